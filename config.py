@@ -5,8 +5,11 @@ Loads and provides access to configuration parameters.
 
 import os
 import json
+import time
+import atexit
 import logging
-from typing import Dict, Any, List
+import threading
+from typing import Dict, Any, List, Optional
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -29,6 +32,19 @@ DEFAULT_CONFIG = {
 
 CONFIG_FILE = "config.json"
 
+# Last configuration read from or written to CONFIG_FILE, keyed by its mtime
+_config_cache: Optional[Dict[str, Any]] = None
+_config_mtime_ns: int = 0
+
+# Minimum seconds between writes triggered by update_config
+CONFIG_FLUSH_INTERVAL = 1.0
+
+# Updates from update_config that haven't been written to CONFIG_FILE yet
+_pending_config: Dict[str, Any] = {}
+_last_flush: float = 0.0
+_flush_timer: Optional[threading.Timer] = None
+_config_lock = threading.RLock()
+
 def load_config() -> Dict[str, Any]:
     """
     Load configuration from config.json file if it exists,
@@ -37,14 +53,24 @@ def load_config() -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Configuration dictionary
     """
+    global _config_cache, _config_mtime_ns
+    
     config = DEFAULT_CONFIG.copy()
     
     try:
         if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                file_config = json.load(f)
-                config.update(file_config)
-                logging.info(f"Configuration loaded from {CONFIG_FILE}")
+            # Skip the disk read when the file hasn't changed since we last saw it
+            mtime_ns = os.stat(CONFIG_FILE).st_mtime_ns
+            if _config_cache is not None and mtime_ns == _config_mtime_ns:
+                config = _config_cache.copy()
+            else:
+                with open(CONFIG_FILE, 'r') as f:
+                    file_config = json.load(f)
+                    config.update(file_config)
+                    logging.info(f"Configuration loaded from {CONFIG_FILE}")
+                
+                _config_cache = config.copy()
+                _config_mtime_ns = mtime_ns
         else:
             logging.info(f"No config file found at {CONFIG_FILE}. Using default configuration.")
             # Create default config file for future use
@@ -52,6 +78,8 @@ def load_config() -> Dict[str, Any]:
     except Exception as e:
         logging.error(f"Error loading configuration: {str(e)}. Using default configuration.")
     
+    # Overlay updates that haven't been flushed to disk yet
+    config.update(_pending_config)
     return config
 
 def save_config(config: Dict[str, Any]) -> None:
@@ -61,9 +89,14 @@ def save_config(config: Dict[str, Any]) -> None:
     Args:
         config (Dict[str, Any]): Configuration dictionary to save
     """
+    global _config_cache, _config_mtime_ns
+    
     try:
         with open(CONFIG_FILE, 'w') as f:
             json.dump(config, f, indent=4)
+        
+        _config_cache = config.copy()
+        _config_mtime_ns = os.stat(CONFIG_FILE).st_mtime_ns
         logging.info(f"Configuration saved to {CONFIG_FILE}")
     except Exception as e:
         logging.error(f"Error saving configuration: {str(e)}")
@@ -86,7 +119,36 @@ def update_config(key: str, value: Any) -> None:
         key (str): Configuration key to update
         value (Any): New value for the configuration key
     """
-    config = load_config()
-    config[key] = value
-    save_config(config)
-    logging.info(f"Configuration updated: {key} = {value}")
+    global _flush_timer
+    
+    with _config_lock:
+        _pending_config[key] = value
+        logging.info(f"Configuration updated: {key} = {value}")
+        
+        # Write now unless we wrote very recently; otherwise coalesce into one deferred write
+        if time.monotonic() - _last_flush >= CONFIG_FLUSH_INTERVAL:
+            flush_config()
+        elif _flush_timer is None:
+            _flush_timer = threading.Timer(CONFIG_FLUSH_INTERVAL, flush_config)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+def flush_config() -> None:
+    """
+    Write pending configuration updates to the config file.
+    Registered with atexit so deferred updates are not lost on shutdown.
+    """
+    global _last_flush, _flush_timer
+    
+    with _config_lock:
+        _flush_timer = None
+        if not _pending_config:
+            return
+        
+        # load_config already overlays the pending updates
+        config = load_config()
+        _pending_config.clear()
+        save_config(config)
+        _last_flush = time.monotonic()
+
+atexit.register(flush_config)
@@ -3,48 +3,11 @@ Trading Pairs module for trading bot.
 Handles forex and crypto pair standardization and information.
 """
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Tuple
 
-# Standard trading pairs supported by the bot
-SUPPORTED_PAIRS = [
-    # Forex pairs
-    "EUR/USD", "GBP/USD", "USD/JPY", "USD/CHF", 
-    "USD/CAD", "AUD/USD", "NZD/USD", "EUR/GBP",
-    "EUR/JPY", "GBP/JPY", "USD/ZAR", "USD/MXN",
-    # Crypto pairs
-    "BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT",
-    "XRPUSDT", "SOLUSDT", "DOGEUSDT", "DOTUSDT"
-]
-
-# Mapping between traditional notation and TradingView symbols
-TRADINGVIEW_SYMBOL_MAPPING = {
-    # Forex pairs
-    "EUR/USD": "EURUSD",
-    "GBP/USD": "GBPUSD",
-    "USD/JPY": "USDJPY",
-    "USD/CHF": "USDCHF",
-    "USD/CAD": "USDCAD",
-    "AUD/USD": "AUDUSD",
-    "NZD/USD": "NZDUSD",
-    "EUR/GBP": "EURGBP",
-    "EUR/JPY": "EURJPY",
-    "GBP/JPY": "GBPJPY",
-    "USD/ZAR": "USDZAR",
-    "USD/MXN": "USDMXN",
-    # Crypto pairs (already in correct format)
-    "BTCUSDT": "BTCUSDT",
-    "ETHUSDT": "ETHUSDT",
-    "BNBUSDT": "BNBUSDT",
-    "ADAUSDT": "ADAUSDT",
-    "XRPUSDT": "XRPUSDT",
-    "SOLUSDT": "SOLUSDT",
-    "DOGEUSDT": "DOGEUSDT",
-    "DOTUSDT": "DOTUSDT"
-}
-
-# Pip size for each pair
-PIP_SIZE = {
-    # Forex pairs
+# Pip size for each forex pair
+FOREX_PIP_SIZE = {
     "EUR/USD": 0.0001,
     "GBP/USD": 0.0001,
     "USD/JPY": 0.01,
@@ -56,8 +19,11 @@ PIP_SIZE = {
     "EUR/JPY": 0.01,
     "GBP/JPY": 0.01,
     "USD/ZAR": 0.0001,
-    "USD/MXN": 0.0001,
-    # Crypto pairs (using appropriate decimal places for each)
+    "USD/MXN": 0.0001
+}
+
+# Pip size for each crypto pair (using appropriate decimal places for each)
+CRYPTO_PIP_SIZE = {
     "BTCUSDT": 1.0,       # $1 movements for BTC
     "ETHUSDT": 0.1,       # $0.10 movements for ETH
     "BNBUSDT": 0.01,      # $0.01 movements for BNB
@@ -68,6 +34,23 @@ PIP_SIZE = {
     "DOTUSDT": 0.001      # $0.001 movements for DOT
 }
 
+# Standard trading pairs supported by the bot (forex first, then crypto)
+SUPPORTED_PAIRS = (*FOREX_PIP_SIZE, *CRYPTO_PIP_SIZE)
+
+# Set view of SUPPORTED_PAIRS for O(1) membership checks
+SUPPORTED_PAIRS_SET = frozenset(SUPPORTED_PAIRS)
+
+# Mapping between traditional notation and TradingView symbols, derived from
+# the pair tables so the two can never drift (crypto pairs map to themselves)
+TRADINGVIEW_SYMBOL_MAPPING = MappingProxyType({pair: pair.replace("/", "") for pair in SUPPORTED_PAIRS})
+
+# Pip size for every supported pair
+PIP_SIZE = MappingProxyType({**FOREX_PIP_SIZE, **CRYPTO_PIP_SIZE})
+
+# Bound lookups for the per-signal helpers below
+_tv_symbol_get = TRADINGVIEW_SYMBOL_MAPPING.get
+_pip_size_get = PIP_SIZE.get
+
 def standardize_pair_format(pair: str) -> str:
     """
     Convert traditional forex pair notation to TradingView format.
@@ -78,12 +61,9 @@ def standardize_pair_format(pair: str) -> str:
     Returns:
         str: Forex pair in TradingView format (e.g., "GBPUSD")
     """
-    # Check if the pair is already in the TradingView format
-    if "/" not in pair:
-        return pair
-        
-    # Convert traditional notation to TradingView format
-    return TRADINGVIEW_SYMBOL_MAPPING.get(pair, pair.replace("/", ""))
+    # Known pairs (including crypto, already in TradingView format) map directly;
+    # anything else just drops the separator
+    return _tv_symbol_get(pair) or pair.replace("/", "")
 
 def get_pip_value(pair: str) -> float:
     """
@@ -95,13 +75,13 @@ def get_pip_value(pair: str) -> float:
     Returns:
         float: Value of 1 pip in price units
     """
-    return PIP_SIZE.get(pair, 0.0001)
+    return _pip_size_get(pair, 0.0001)
 
-def get_supported_pairs() -> List[str]:
+def get_supported_pairs() -> Tuple[str, ...]:
     """
-    Get the list of supported forex pairs.
+    Get the supported forex and crypto pairs.
     
     Returns:
-        List[str]: List of supported forex pairs
+        Tuple[str, ...]: Supported pairs (immutable, safe to share)
     """
     return SUPPORTED_PAIRS
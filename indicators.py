@@ -3,8 +3,81 @@ Technical indicators module for forex trading bot.
 Implements various technical analysis indicators.
 """
 
-from typing import List, Tuple, Dict, Any
+from functools import lru_cache
+from typing import List, Tuple, Dict, Any, Callable
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+def _as_f64(values: List[float]) -> np.ndarray:
+    """
+    Convert price values to a contiguous float64 array (no copy if already one).
+    
+    Args:
+        values (List[float]): Price values (list or array)
+        
+    Returns:
+        np.ndarray: Contiguous float64 array
+    """
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+def calculate_sma_series(prices: List[float], period: int) -> np.ndarray:
+    """
+    Calculate the Simple Moving Average (SMA) for every full window.
+    
+    Args:
+        prices (List[float]): List of price values
+        period (int): SMA period
+        
+    Returns:
+        np.ndarray: SMA values for prices[period - 1:] (empty if not enough data)
+    """
+    arr = _as_f64(prices)
+    if len(arr) < period:
+        return np.empty(0)
+    
+    # Each window sum is a difference of two running totals
+    totals = np.concatenate(([0.0], np.cumsum(arr)))
+    return (totals[period:] - totals[:-period]) / period
+
+def calculate_rsi_series(prices: List[float], period: int = 14) -> np.ndarray:
+    """
+    Calculate the Relative Strength Index (RSI) for every bar after the warm-up,
+    using Wilder's smoothing of average gains and losses.
+    
+    Args:
+        prices (List[float]): List of price values
+        period (int): RSI period
+        
+    Returns:
+        np.ndarray: RSI values for prices[period:] (empty if not enough data)
+    """
+    if len(prices) < period + 1:
+        return np.empty(0)
+    
+    # Calculate price changes and split them into gains and losses in place,
+    # reusing the deltas buffer for gains so only two arrays are allocated
+    deltas = np.diff(_as_f64(prices))
+    losses = np.negative(deltas)
+    np.maximum(losses, 0.0, out=losses)
+    gains = np.maximum(deltas, 0.0, out=deltas)
+    
+    avg_gains = np.empty(len(deltas) - period + 1)
+    avg_losses = np.empty_like(avg_gains)
+    
+    # Seed with simple averages over the first period
+    avg_gain = avg_gains[0] = gains[:period].mean()
+    avg_loss = avg_losses[0] = losses[:period].mean()
+    
+    # Wilder's smoothing: each new bar contributes 1/period of the average
+    for i, (gain, loss) in enumerate(zip(gains[period:].tolist(), losses[period:].tolist()), 1):
+        avg_gain = avg_gains[i] = (avg_gain * (period - 1) + gain) / period
+        avg_loss = avg_losses[i] = (avg_loss * (period - 1) + loss) / period
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gains / avg_losses))
+    rsi[avg_losses == 0] = 100  # No losses means RSI = 100
+    
+    return rsi
 
 def calculate_rsi(prices: List[float], period: int = 14) -> float:
     """
@@ -15,36 +88,81 @@ def calculate_rsi(prices: List[float], period: int = 14) -> float:
         period (int): RSI period
         
     Returns:
-        float: RSI value
+        float: RSI value for the latest price
     """
     if len(prices) < period + 1:
         return 50  # Default value if not enough data
     
-    # Calculate price changes
-    deltas = np.diff(prices)
+    return float(calculate_rsi_series(prices, period)[-1])
+
+# Longest stretch of bars make_ema_fn evaluates in one vectorized step
+EMA_BLOCK_SIZE = 4096
+
+@lru_cache(maxsize=32)
+def make_ema_fn(period: int) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build an EMA series function specialized for one period.
     
-    # Separate gains and losses
-    gains = np.copy(deltas)
-    losses = np.copy(deltas)
+    The multiplier and the table of decay powers depend only on the period,
+    so they are computed once here and reused by every call of the returned
+    function (periods are fixed by the configuration).
     
-    gains[gains < 0] = 0
-    losses[losses > 0] = 0
-    losses = abs(losses)
+    Args:
+        period (int): EMA period
+        
+    Returns:
+        Callable[[np.ndarray], np.ndarray]: Function mapping a float64 price array
+            with at least period values to its EMA series (see calculate_ema_series)
+    """
+    # Calculate the multiplier
+    multiplier = 2 / (period + 1)
+    decay = 1 - multiplier
     
-    # Calculate average gains and losses
-    avg_gain = np.mean(gains[:period])
-    avg_loss = np.mean(losses[:period])
+    # Closed form of ema[j] = decay * ema[j-1] + multiplier * price[j]:
+    #   ema[j] = decay^(j+1) * (ema[-1] + multiplier * sum_{k<=j} price[k] / decay^(k+1))
+    # evaluated in blocks short enough that decay^-(k+1) cannot overflow.
+    if decay > 0:
+        block = max(1, min(EMA_BLOCK_SIZE, int(-250 / np.log10(decay))))
+        powers = decay ** np.arange(1, block + 1)
+        powers.flags.writeable = False
     
-    if avg_loss == 0:
-        return 100  # No losses means RSI = 100
+    def ema_series(arr: np.ndarray) -> np.ndarray:
+        out = np.empty(len(arr) - period + 1)
+        out[0] = arr[:period].mean()  # Initial SMA
+        rest = arr[period:]
+        if decay == 0:
+            out[1:] = rest  # Period 1: the EMA is the price itself
+            return out
+        
+        ema = out[0]
+        for start in range(0, len(rest), block):
+            chunk = rest[start:start + block]
+            scale = powers[:len(chunk)]
+            values = scale * (ema + multiplier * np.cumsum(chunk / scale))
+            out[start + 1:start + 1 + len(chunk)] = values
+            ema = values[-1]
+        
+        return out
     
-    # Calculate initial RS
-    rs = avg_gain / avg_loss
+    return ema_series
+
+def calculate_ema_series(prices: List[float], period: int) -> np.ndarray:
+    """
+    Calculate the Exponential Moving Average (EMA) for every bar after the warm-up.
     
-    # Calculate RSI
-    rsi = 100 - (100 / (1 + rs))
+    Args:
+        prices (List[float]): List of price values
+        period (int): EMA period
+        
+    Returns:
+        np.ndarray: EMA values for prices[period - 1:], seeded with the SMA of the
+            first period prices (empty if not enough data)
+    """
+    arr = _as_f64(prices)
+    if len(arr) < period:
+        return np.empty(0)
     
-    return rsi
+    return make_ema_fn(period)(arr)
 
 def calculate_ema(prices: List[float], period: int) -> float:
     """
@@ -57,20 +175,34 @@ def calculate_ema(prices: List[float], period: int) -> float:
     Returns:
         float: EMA value
     """
-    if len(prices) < period:
-        return sum(prices) / len(prices)  # Simple average if not enough data
+    arr = _as_f64(prices)
+    if len(arr) < period:
+        return float(arr.mean())  # Simple average if not enough data
     
-    # Calculate the multiplier
-    multiplier = 2 / (period + 1)
+    return float(calculate_ema_series(arr, period)[-1])
+
+def detect_ema_crossovers(fast_ema: List[float], slow_ema: List[float]) -> np.ndarray:
+    """
+    Detect EMA crossovers at every bar.
     
-    # Calculate the initial SMA
-    ema = sum(prices[:period]) / period
+    Args:
+        fast_ema (List[float]): Fast EMA values (shorter period)
+        slow_ema (List[float]): Slow EMA values (longer period), aligned with fast_ema
+        
+    Returns:
+        np.ndarray: int8 array with 1 for a bullish crossover, -1 for a bearish
+            crossover and 0 otherwise (the first bar is always 0)
+    """
+    # Side of the slow EMA the fast EMA is on: 1 above, -1 below, 0 touching
+    side = np.sign(_as_f64(fast_ema) - _as_f64(slow_ema)).astype(np.int8)
     
-    # Calculate EMA for each period
-    for price in prices[period:]:
-        ema = (price - ema) * multiplier + ema
+    crossovers = np.zeros(len(side), dtype=np.int8)
+    if len(side) > 1:
+        # Only a move from strictly below to strictly above (or vice versa) counts
+        step = side[1:] - side[:-1]
+        crossovers[1:] = (step == 2).astype(np.int8) - (step == -2).astype(np.int8)
     
-    return ema
+    return crossovers
 
 def detect_ema_crossover(fast_ema: List[float], slow_ema: List[float]) -> str:
     """
@@ -86,18 +218,12 @@ def detect_ema_crossover(fast_ema: List[float], slow_ema: List[float]) -> str:
     if len(fast_ema) < 2 or len(slow_ema) < 2:
         return "NEUTRAL"  # Not enough data
     
-    # Check current relationship
-    current_fast = fast_ema[-1]
-    current_slow = slow_ema[-1]
-    
-    # Check previous relationship
-    prev_fast = fast_ema[-2]
-    prev_slow = slow_ema[-2]
+    # Compare the previous and current relationship
+    crossover = detect_ema_crossovers(fast_ema[-2:], slow_ema[-2:])[-1]
     
-    # Detect crossover
-    if prev_fast < prev_slow and current_fast > current_slow:
+    if crossover > 0:
         return "BUY"  # Bullish crossover
-    elif prev_fast > prev_slow and current_fast < current_slow:
+    elif crossover < 0:
         return "SELL"  # Bearish crossover
     else:
         return "NEUTRAL"  # No crossover
@@ -116,21 +242,116 @@ def calculate_macd(prices: List[float], fast_period: int = 12,
     Returns:
         Tuple[float, float, float]: MACD line, signal line, and histogram
     """
-    # Calculate fast and slow EMAs
-    fast_ema = calculate_ema(prices, fast_period)
-    slow_ema = calculate_ema(prices, slow_period)
+    if len(prices) < max(fast_period, slow_period):
+        # Not enough data for a MACD series; fall back to the single-value EMAs
+        macd_line = calculate_ema(prices, fast_period) - calculate_ema(prices, slow_period)
+        return macd_line, macd_line, 0.0
+    
+    arr = _as_f64(prices)
+    
+    # Calculate fast and slow EMA series
+    fast_ema = calculate_ema_series(arr, fast_period)
+    slow_ema = calculate_ema_series(arr, slow_period)
+    
+    return _macd_from_ema_series(fast_ema, slow_ema, signal_period)
+
+def _macd_from_ema_series(fast_ema: np.ndarray, slow_ema: np.ndarray,
+                          signal_period: int) -> Tuple[float, float, float]:
+    """
+    Calculate the latest MACD values from precomputed fast and slow EMA series.
+    
+    Args:
+        fast_ema (np.ndarray): Fast EMA series (from calculate_ema_series)
+        slow_ema (np.ndarray): Slow EMA series (from calculate_ema_series)
+        signal_period (int): Signal EMA period
+        
+    Returns:
+        Tuple[float, float, float]: MACD line, signal line, and histogram
+    """
+    # Align the two series on the last bars
+    length = min(len(fast_ema), len(slow_ema))
     
-    # Calculate MACD line
-    macd_line = fast_ema - slow_ema
+    # Calculate MACD line series
+    macd_series = fast_ema[-length:] - slow_ema[-length:]
+    macd_line = float(macd_series[-1])
     
-    # Calculate signal line (EMA of MACD line)
-    signal_line = calculate_ema([macd_line], signal_period)
+    # Calculate signal line (EMA of the MACD line series)
+    if length < signal_period:
+        signal_line = float(macd_series.mean())
+    else:
+        signal_line = float(calculate_ema_series(macd_series, signal_period)[-1])
     
     # Calculate histogram
     histogram = macd_line - signal_line
     
     return macd_line, signal_line, histogram
 
+def calculate_indicators(prices: List[float], rsi_period: int = 14, fast_period: int = 12,
+                         slow_period: int = 26, signal_period: int = 9) -> Dict[str, float]:
+    """
+    Calculate RSI, fast/slow EMA and MACD together.
+    
+    The prices are converted to an array once and the EMA series are shared
+    between the EMA and MACD results, instead of each indicator walking the
+    price list on its own.
+    
+    Args:
+        prices (List[float]): List of price values
+        rsi_period (int): RSI period
+        fast_period (int): Fast EMA period (also used for MACD)
+        slow_period (int): Slow EMA period (also used for MACD)
+        signal_period (int): MACD signal EMA period
+        
+    Returns:
+        Dict[str, float]: Latest values keyed by "rsi", "ema_fast", "ema_slow",
+            "macd", "macd_signal" and "macd_histogram"
+    """
+    arr = _as_f64(prices)
+    rsi = calculate_rsi(arr, rsi_period)
+    
+    if len(arr) < max(fast_period, slow_period):
+        # Not enough data for EMA series; use the single-value fallbacks
+        ema_fast = float(calculate_ema(arr, fast_period))
+        ema_slow = float(calculate_ema(arr, slow_period))
+        macd_line = signal_line = ema_fast - ema_slow
+        histogram = 0.0
+    else:
+        fast_series = calculate_ema_series(arr, fast_period)
+        slow_series = calculate_ema_series(arr, slow_period)
+        ema_fast = float(fast_series[-1])
+        ema_slow = float(slow_series[-1])
+        macd_line, signal_line, histogram = _macd_from_ema_series(fast_series, slow_series, signal_period)
+    
+    return {
+        "rsi": rsi,
+        "ema_fast": ema_fast,
+        "ema_slow": ema_slow,
+        "macd": macd_line,
+        "macd_signal": signal_line,
+        "macd_histogram": histogram
+    }
+
+def _filter_close_levels(levels: List[float], threshold: float) -> List[float]:
+    """
+    Drop levels within threshold (relative) of a smaller level that was kept.
+    
+    Sorting first means each level only has to be compared with the last
+    kept one, instead of with every kept level.
+    
+    Args:
+        levels (List[float]): Candidate price levels
+        threshold (float): Minimum relative distance between kept levels
+        
+    Returns:
+        List[float]: Kept levels in ascending order
+    """
+    filtered = []
+    for level in sorted(levels):
+        if not filtered or (level - filtered[-1]) / level >= threshold:
+            filtered.append(level)
+    
+    return filtered
+
 def detect_support_resistance(prices: List[float], window: int = 10, 
                             threshold: float = 0.01) -> Dict[str, List[float]]:
     """
@@ -142,38 +363,25 @@ def detect_support_resistance(prices: List[float], window: int = 10,
         threshold (float): Percentage threshold for level significance
         
     Returns:
-        Dict[str, List[float]]: Dictionary with support and resistance levels
+        Dict[str, List[float]]: Dictionary with support and resistance levels (ascending)
     """
     if len(prices) < window * 2:
         return {"support": [], "resistance": []}
     
-    support_levels = []
-    resistance_levels = []
+    arr = _as_f64(prices)
     
-    for i in range(window, len(prices) - window):
-        # Get window of prices
-        left_window = prices[i-window:i]
-        right_window = prices[i:i+window]
-        current_price = prices[i]
-        
-        # Check for local minima (support)
-        if current_price <= min(left_window) and current_price <= min(right_window):
-            support_levels.append(current_price)
-        
-        # Check for local maxima (resistance)
-        if current_price >= max(left_window) and current_price >= max(right_window):
-            resistance_levels.append(current_price)
+    # Price i is a level when it is the extreme of prices[i-window:i+window];
+    # window j of the rolling view starts at j, i.e. belongs to price j + window
+    windows = sliding_window_view(arr, window * 2)[:len(arr) - window * 2]
+    centers = arr[window:len(arr) - window]
+    
+    # Local minima (support) and local maxima (resistance)
+    support_levels = centers[centers <= windows.min(axis=1)].tolist()
+    resistance_levels = centers[centers >= windows.max(axis=1)].tolist()
     
     # Filter out levels that are too close to each other
-    filtered_support = []
-    for level in support_levels:
-        if not any(abs(level - s) / level < threshold for s in filtered_support):
-            filtered_support.append(level)
-    
-    filtered_resistance = []
-    for level in resistance_levels:
-        if not any(abs(level - r) / level < threshold for r in filtered_resistance):
-            filtered_resistance.append(level)
+    filtered_support = _filter_close_levels(support_levels, threshold)
+    filtered_resistance = _filter_close_levels(resistance_levels, threshold)
     
     return {
         "support": filtered_support,
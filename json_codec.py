@@ -0,0 +1,26 @@
+"""
+JSON codec module for forex trading bot.
+Shared orjson-based encoding and decoding for broker, TradingView and signal payloads.
+"""
+
+from typing import Any
+
+import orjson
+
+# Decode JSON from bytes or str (errors subclass json.JSONDecodeError)
+loads = orjson.loads
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode an object as UTF-8 JSON.
+
+    NumPy scalars and arrays (e.g. indicator values or TP/SL levels) are
+    serialized directly.
+
+    Args:
+        obj (Any): Object to encode
+
+    Returns:
+        bytes: UTF-8 JSON encoding of obj
+    """
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
@@ -4,11 +4,22 @@ Configures and provides logging functionality.
 """
 
 import logging
+import logging.handlers
 import os
 import sys
+import queue
+import atexit
 from datetime import datetime
 from typing import Optional
 
+# Rotate log files at this size, keeping LOG_BACKUP_COUNT old files
+LOG_MAX_BYTES = 10_000_000
+LOG_BACKUP_COUNT = 5
+
+# Background listener that writes queued records to the console and log file
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
 def setup_logger(log_level: str = "INFO", 
                  log_file: Optional[str] = None) -> logging.Logger:
     """
@@ -37,8 +48,10 @@ def setup_logger(log_level: str = "INFO",
     logger.setLevel(numeric_level)
     
     # Clear existing handlers
+    stop_logger()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+        handler.close()
     
     # Format for log messages
     formatter = logging.Formatter(
@@ -49,33 +62,58 @@ def setup_logger(log_level: str = "INFO",
     # Always add console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
     
     # Add file handler if specified
-    if log_file:
-        # Ensure logs directory exists
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        
-        logger.info(f"Logging to file: {log_file}")
-    else:
+    if not log_file:
         # Create default log file with timestamp
         timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
         log_dir = "logs"
+        log_file = os.path.join(log_dir, f"forex_bot_{timestamp}.log")
+    
+    # Ensure logs directory exists
+    log_dir = os.path.dirname(log_file)
+    if log_dir:
         os.makedirs(log_dir, exist_ok=True)
-        
-        default_log_file = os.path.join(log_dir, f"forex_bot_{timestamp}.log")
-        file_handler = logging.FileHandler(default_log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        
-        logger.info(f"Logging to file: {default_log_file}")
+    
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+    )
+    file_handler.setFormatter(formatter)
+    
+    # Log calls only enqueue the record; a listener thread does the console
+    # and file I/O so it stays off the scheduler and analyzer threads
+    global _listener, _queue_handler
+    log_queue = queue.Queue(-1)
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(_queue_handler)
+    _listener = logging.handlers.QueueListener(log_queue, console_handler, file_handler)
+    _listener.start()
+    
+    logger.info("Logging to file: %s", log_file)
     
     return logger
 
+def stop_logger() -> None:
+    """
+    Flush queued log records and stop the background logging listener.
+    
+    The console and file handlers are moved back onto the root logger, so
+    records logged afterwards (e.g. by other atexit hooks) are still written
+    synchronously. Safe to call more than once.
+    """
+    global _listener, _queue_handler
+    
+    if _listener is not None:
+        root = logging.getLogger()
+        root.removeHandler(_queue_handler)
+        for handler in _listener.handlers:
+            root.addHandler(handler)
+        _listener.stop()
+        _listener = None
+        _queue_handler = None
+
+atexit.register(stop_logger)
+
 def log_trade(logger: logging.Logger, action: str, symbol: str, 
               price: float, amount: float, trade_id: Optional[str] = None) -> None:
     """
@@ -13,7 +13,10 @@ from scheduler import Scheduler
 from market_analyzer import MarketAnalyzer
 from trade_executor import TradeExecutor
 from broker_api import AllCashBrokerAPI
-from logger import setup_logger
+from logger import setup_logger, stop_logger
+
+# Pairs analyzed when the configuration doesn't list any
+DEFAULT_PAIRS = ("GBP/USD", "USD/CHF", "USD/CAD")
 
 def main():
     """Main entry point for the forex trading bot."""
@@ -27,6 +30,10 @@ def main():
         config = load_config()
         logger.info("Configuration loaded successfully")
         
+        pairs = config.get("forex_pairs", DEFAULT_PAIRS)
+        demo_mode = config.get("demo_mode", True)
+        interval_minutes = config.get("schedule_interval_minutes", 1)
+        
         # Initialize broker API with API key
         api_key = os.environ.get("ALLCASH_API_KEY", config.get("api_key", "qrlwfzlxha"))
         if not api_key:
@@ -40,13 +47,13 @@ def main():
         
         broker_api = AllCashBrokerAPI(
             api_key=api_key,
-            demo_mode=config.get("demo_mode", True)
+            demo_mode=demo_mode
         )
-        logger.info("Broker API initialized. Demo mode: %s", config.get("demo_mode", True))
+        logger.info("Broker API initialized. Demo mode: %s", demo_mode)
         
         # Initialize market analyzer
         market_analyzer = MarketAnalyzer(
-            symbols=config.get("forex_pairs", ["GBP/USD", "USD/CHF", "USD/CAD"]),
+            symbols=pairs,
             interval=config.get("analysis_interval", "1h"),
             rsi_period=config.get("rsi_period", 14),
             rsi_overbought=config.get("rsi_overbought", 70),
@@ -54,8 +61,7 @@ def main():
             ema_fast_period=config.get("ema_fast_period", 9),
             ema_slow_period=config.get("ema_slow_period", 21)
         )
-        logger.info("Market analyzer initialized with %d forex pairs", 
-                   len(config.get("forex_pairs", ["GBP/USD", "USD/CHF", "USD/CAD"])))
+        logger.info("Market analyzer initialized with %d forex pairs", len(pairs))
         
         # Initialize trade executor
         trade_executor = TradeExecutor(
@@ -63,7 +69,8 @@ def main():
             trade_amount=config.get("trade_amount", 100),
             take_profit_pips=config.get("take_profit_pips", 20),
             stop_loss_pips=config.get("stop_loss_pips", 10),
-            max_trades_per_day=config.get("max_trades_per_day", 5)
+            max_trades_per_day=config.get("max_trades_per_day", 5),
+            symbols=pairs
         )
         logger.info("Trade executor initialized")
         
@@ -71,10 +78,9 @@ def main():
         scheduler = Scheduler(
             market_analyzer=market_analyzer,
             trade_executor=trade_executor,
-            analysis_interval_minutes=config.get("schedule_interval_minutes", 1)
+            analysis_interval_minutes=interval_minutes
         )
-        logger.info("Scheduler initialized with %d minute intervals", 
-                   config.get("schedule_interval_minutes", 1))
+        logger.info("Scheduler initialized with %d minute intervals", interval_minutes)
         
         # Enviar una orden de prueba en modo demo probando diferentes pares y configuraciones
         logger.info("Enviando una orden de prueba en la cuenta demo...")
@@ -118,12 +124,14 @@ def main():
         except KeyboardInterrupt:
             logger.info("Keyboard interrupt detected. Shutting down...")
             scheduler.stop()
+            market_analyzer.close()
             
     except Exception as e:
         logger.exception("Unexpected error occurred: %s", str(e))
     
     logger.info("Forex trading bot shutting down at %s", 
                datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    stop_logger()
 
 if __name__ == "__main__":
     main()
@@ -4,12 +4,198 @@ Analyzes forex market using TradingView technical indicators.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import time
-from tradingview_ta import TA_Handler, Interval, Exchange
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from tradingview_ta import TA_Handler, Interval, Exchange, __version__ as tradingview_ta_version
+from tradingview_ta.main import TradingView, calculate
 
 from signals import TradingSignal
 from forex_pairs import standardize_pair_format
+from config import load_config, update_config
+import json_codec
+
+# Quote currencies that mark a slash-less symbol as a crypto pair (e.g. "BTCUSDT")
+CRYPTO_QUOTES = ("USDT", "BUSD", "USDC", "BTC", "ETH")
+
+# Exchanges to try for crypto pairs that the default exchange doesn't list
+ALTERNATE_CRYPTO_EXCHANGES = ("KUCOIN", "COINBASE", "FTX")
+
+# Exchange found for a TradingView symbol after its default exchange failed,
+# or None when no alternate worked. Successful lookups are persisted in the
+# "crypto_exchanges" config entry so they survive restarts.
+_resolved_exchanges: Dict[str, Optional[str]] = {}
+_resolved_exchanges_lock = threading.Lock()
+
+class PooledTAHandler(TA_Handler):
+    """
+    TA_Handler that sends its scan requests through a shared requests.Session.
+    
+    The stock handler calls requests.post, which opens a new connection (and
+    TLS handshake) on every analysis; a shared session keeps connections alive.
+    """
+    
+    def __init__(self, session: requests.Session, **kwargs):
+        """
+        Initialize PooledTAHandler.
+        
+        Args:
+            session (requests.Session): Session used for TradingView requests
+            **kwargs: TA_Handler arguments (symbol, exchange, screener, interval, ...)
+        """
+        super().__init__(**kwargs)
+        self.session = session
+    
+    def get_indicators(self, indicators=[]):
+        """
+        Fetch indicator values from TradingView (same contract as TA_Handler.get_indicators).
+        
+        Args:
+            indicators (list): Indicator names to request (defaults to self.indicators)
+            
+        Returns:
+            dict: Indicator values keyed by indicator name
+        """
+        if len(indicators) == 0:
+            indicators = self.indicators
+        
+        if self.screener == "" or type(self.screener) != str:
+            raise Exception("Screener is empty or not valid.")
+        elif self.exchange == "" or type(self.exchange) != str:
+            raise Exception("Exchange is empty or not valid.")
+        elif self.symbol == "" or type(self.symbol) != str:
+            raise Exception("Symbol is empty or not valid.")
+        
+        data = TradingView.data([f"{self.exchange}:{self.symbol}"], self.interval, indicators)
+        scan_url = f"{TradingView.scan_url}{self.screener.lower()}/scan"
+        headers = {"User-Agent": f"tradingview_ta/{tradingview_ta_version}",
+                   "Content-Type": "application/json"}
+        response = self.session.post(scan_url, data=json_codec.dumps(data), headers=headers,
+                                     timeout=self.timeout, proxies=self.proxies)
+        
+        if response.status_code != 200:
+            raise Exception(f"Can't access TradingView's API. HTTP status code: {response.status_code}. "
+                            "Check for invalid symbol, exchange, or indicators.")
+        
+        result = json_codec.loads(response.content)["data"]
+        if not result:
+            raise Exception("Exchange or symbol not found.")
+        
+        return dict(zip(indicators, result[0]["d"]))
+
+def _is_crypto(symbol: str) -> bool:
+    """
+    Check whether a symbol is a crypto pair rather than a forex pair.
+    
+    Forex pairs use the "BASE/QUOTE" notation; crypto pairs are written without
+    a separator and quoted in a stablecoin or major coin. Symbols such as
+    "XAUUSD" are therefore not treated as crypto.
+    
+    Args:
+        symbol (str): Trading pair (e.g., "GBP/USD" or "BTCUSDT")
+        
+    Returns:
+        bool: True for crypto pairs
+    """
+    return "/" not in symbol and symbol.upper().endswith(CRYPTO_QUOTES)
+
+# Signal names for the integer codes returned by _evaluate_signal_code
+SIGNAL_NAMES = {1: "BUY", -1: "SELL", 0: "NEUTRAL"}
+
+def _evaluate_signal_code(rsi: float, ema_fast: float, ema_slow: float,
+                          rsi_oversold: float, rsi_overbought: float) -> Tuple[int, float]:
+    """
+    Evaluate RSI and EMA indicators to determine trading signal.
+    
+    Works on plain numbers and integer codes only (no instance state or
+    string comparisons), so it can be called per tick or compiled as is.
+    
+    Args:
+        rsi (float): RSI indicator value
+        ema_fast (float): Fast EMA value
+        ema_slow (float): Slow EMA value
+        rsi_oversold (float): RSI oversold threshold
+        rsi_overbought (float): RSI overbought threshold
+        
+    Returns:
+        Tuple[int, float]: Signal code (1 = BUY, -1 = SELL, 0 = NEUTRAL) and strength (0.0 to 1.0)
+    """
+    # RSI signals (strength increases as RSI moves beyond the threshold)
+    if rsi < rsi_oversold:
+        rsi_signal = 1
+        rsi_strength = min(1.0, (rsi_oversold - rsi) / 10)
+    elif rsi > rsi_overbought:
+        rsi_signal = -1
+        rsi_strength = min(1.0, (rsi - rsi_overbought) / 10)
+    else:
+        rsi_signal = 0
+        rsi_strength = 0.0
+    
+    # EMA crossover signals (normalized difference between EMAs)
+    if ema_fast > ema_slow:
+        ema_signal = 1
+        ema_strength = min(1.0, (ema_fast - ema_slow) / ema_slow * 10)
+    elif ema_fast < ema_slow:
+        ema_signal = -1
+        ema_strength = min(1.0, (ema_slow - ema_fast) / ema_slow * 10)
+    else:
+        ema_signal = 0
+        ema_strength = 0.0
+    
+    # Combine signals (if both agree, stronger signal)
+    if rsi_signal == ema_signal and rsi_signal != 0:
+        # Combined strength (average of both signals with a bonus for agreement)
+        return rsi_signal, min(1.0, (rsi_strength + ema_strength) / 2 * 1.2)
+    # If they disagree, use the stronger signal with reduced confidence
+    if rsi_strength > ema_strength and rsi_signal != 0:
+        return rsi_signal, rsi_strength * 0.8
+    if ema_strength > 0 and ema_signal != 0:
+        return ema_signal, ema_strength * 0.8
+    
+    return 0, 0.0
+
+def _make_signal_evaluator(rsi_oversold: float, rsi_overbought: float
+                           ) -> Callable[[float, float, float], Tuple[str, float]]:
+    """
+    Build a signal evaluator with the RSI thresholds bound in.
+    
+    The thresholds are fixed once the analyzer is created, so binding them as
+    default arguments turns per-call attribute lookups into local reads.
+    
+    Args:
+        rsi_oversold (float): RSI oversold threshold
+        rsi_overbought (float): RSI overbought threshold
+        
+    Returns:
+        Callable[[float, float, float], Tuple[str, float]]: Function taking RSI, fast EMA
+            and slow EMA and returning the signal type ("BUY", "SELL", "NEUTRAL") and strength
+    """
+    def evaluate(rsi: float, ema_fast: float, ema_slow: float,
+                 _oversold=rsi_oversold, _overbought=rsi_overbought,
+                 _evaluate=_evaluate_signal_code, _names=SIGNAL_NAMES) -> Tuple[str, float]:
+        code, strength = _evaluate(rsi, ema_fast, ema_slow, _oversold, _overbought)
+        return _names[code], strength
+    
+    return evaluate
+
+def _remember_exchange(tv_symbol: str, exchange: Optional[str]) -> None:
+    """
+    Record the outcome of an alternate exchange search for a symbol.
+    
+    Args:
+        tv_symbol (str): Symbol in TradingView format (e.g., "BTCUSDT")
+        exchange (Optional[str]): Exchange that returned data, or None if none did
+    """
+    with _resolved_exchanges_lock:
+        _resolved_exchanges[tv_symbol] = exchange
+        persisted = {s: e for s, e in _resolved_exchanges.items() if e}
+    
+    if exchange:
+        update_config("crypto_exchanges", persisted)
 
 class MarketAnalyzer:
     """
@@ -17,6 +203,21 @@ class MarketAnalyzer:
     Generates trading signals based on RSI and EMA crossover strategy.
     """
     
+    # Maximum number of TradingView requests in flight at once
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    # Sustained number of TradingView requests started per second
+    MAX_REQUESTS_PER_SECOND = 5
+    
+    # Requests that may start back to back before the per-second rate applies
+    REQUEST_BURST = 5
+    
+    # Seconds analyze_markets results are reused for repeated calls
+    ANALYSIS_CACHE_TTL = 30.0
+    
+    # Seconds to wait for a TradingView scan response (batched or per symbol)
+    SCAN_TIMEOUT = 5.0
+    
     def __init__(self, 
                  symbols: List[str], 
                  interval: str = "1h",
@@ -59,8 +260,37 @@ class MarketAnalyzer:
         self.ema_fast_period = ema_fast_period
         self.ema_slow_period = ema_slow_period
         
+        # Evaluate RSI and EMA indicators to a (signal type, strength) pair, thresholds bound in
+        self._evaluate_signals = _make_signal_evaluator(rsi_oversold, rsi_overbought)
+        
+        # TradingView indicator keys for the configured periods
+        self._rsi_key_alt = f"RSI{rsi_period}"
+        self._ema_fast_key = f"EMA{ema_fast_period}"
+        self._ema_slow_key = f"EMA{ema_slow_period}"
+        
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._rate_lock = threading.Lock()
+        # Token bucket for request starts; tokens go negative while callers wait for reserved slots
+        self._request_tokens = float(self.REQUEST_BURST)
+        self._tokens_updated_at = time.monotonic()
+        
+        # Last analyze_markets result and when it was produced (time.monotonic());
+        # the lock makes concurrent callers wait for one analysis instead of repeating it
+        self._analysis_lock = threading.Lock()
+        self._cached_signals: Optional[Dict[str, TradingSignal]] = None
+        self._cached_at = 0.0
+        
+        # Shared keep-alive connection pool for all TradingView handlers
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=self.MAX_CONCURRENT_REQUESTS))
+        
+        # Reuse exchanges discovered by previous runs
+        with _resolved_exchanges_lock:
+            for tv_symbol, exchange in load_config().get("crypto_exchanges", {}).items():
+                _resolved_exchanges.setdefault(tv_symbol, exchange)
+        
         self.handlers = self._initialize_handlers()
-        self.logger.info(f"MarketAnalyzer initialized with {len(symbols)} symbols")
+        self.logger.info("MarketAnalyzer initialized with %d symbols", len(symbols))
     
     def _initialize_handlers(self) -> Dict[str, TA_Handler]:
         """
@@ -76,52 +306,188 @@ class MarketAnalyzer:
                 tv_symbol = standardize_pair_format(symbol)
                 
                 # Determine exchange and screener based on symbol type
-                if symbol.endswith("USDT") or "USD" in symbol and "/" not in symbol:
-                    # Crypto pairs use Binance exchange and crypto screener
-                    exchange = "BINANCE"
+                if _is_crypto(symbol):
+                    # Crypto pairs use Binance exchange (unless another one is known
+                    # to list the pair) and crypto screener
+                    exchange = _resolved_exchanges.get(tv_symbol) or "BINANCE"
                     screener = "crypto"
-                    self.logger.info(f"Using crypto settings for {symbol}: {exchange}/{screener}")
+                    self.logger.info("Using crypto settings for %s: %s/%s", symbol, exchange, screener)
                 else:
                     # Forex pairs use FX_IDC exchange and forex screener
                     exchange = "FX_IDC"
                     screener = "forex"
                 
-                handler = TA_Handler(
+                handler = PooledTAHandler(
+                    session=self._session,
                     symbol=tv_symbol,
                     exchange=exchange,
                     screener=screener,
-                    interval=self.interval
+                    interval=self.interval,
+                    timeout=self.SCAN_TIMEOUT
                 )
                 handlers[symbol] = handler
-                self.logger.debug(f"Initialized handler for {symbol} ({tv_symbol}) on {exchange}/{screener}")
+                self.logger.debug("Initialized handler for %s (%s) on %s/%s", symbol, tv_symbol, exchange, screener)
             except Exception as e:
-                self.logger.error(f"Error initializing handler for {symbol}: {str(e)}")
+                self.logger.error("Error initializing handler for %s: %s", symbol, e)
         
         return handlers
     
+    def close(self) -> None:
+        """
+        Close the pooled TradingView connections.
+        """
+        self._session.close()
+    
     def analyze_markets(self) -> Dict[str, TradingSignal]:
         """
         Analyze all forex pairs and generate trading signals.
         
+        Calls within ANALYSIS_CACHE_TTL seconds of the previous analysis (e.g. a
+        manual run right after a scheduled one) reuse its signals.
+        
+        Returns:
+            Dict[str, TradingSignal]: Dictionary mapping forex pairs to trading signals
+        """
+        with self._analysis_lock:
+            if (self._cached_signals is not None
+                    and time.monotonic() - self._cached_at < self.ANALYSIS_CACHE_TTL):
+                self.logger.info("Reusing analysis from %.1f seconds ago", time.monotonic() - self._cached_at)
+                return dict(self._cached_signals)
+            
+            signals = self._analyze_all()
+            self._cached_signals = signals
+            self._cached_at = time.monotonic()
+            return dict(signals)
+    
+    def _analyze_all(self) -> Dict[str, TradingSignal]:
+        """
+        Fetch and analyze all forex pairs (uncached).
+        
         Returns:
             Dict[str, TradingSignal]: Dictionary mapping forex pairs to trading signals
         """
         signals = {}
+        symbols = list(self.handlers)
+        if not symbols:
+            return signals
         
-        for symbol, handler in self.handlers.items():
+        # Fetch every symbol in one scan per screener and evaluate them together
+        analyses = self._batch_fetch()
+        batch_signals = self._signals_from_analyses(analyses)
+        
+        # Symbols missing from the batch go through the per-symbol path, which
+        # also tries alternate exchanges. These lookups are I/O-bound, so run them
+        # in parallel; _get_analysis caps the request rate and how many are in flight
+        futures = {}
+        missing = [symbol for symbol in symbols if symbol not in analyses]
+        if missing:
+            workers = min(self.MAX_CONCURRENT_REQUESTS, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {symbol: executor.submit(self.analyze_symbol, symbol) for symbol in missing}
+        
+        for symbol in symbols:
             try:
-                signal = self.analyze_symbol(symbol)
+                if symbol in futures:
+                    signal = futures[symbol].result()
+                else:
+                    signal = batch_signals.get(symbol)
                 if signal:
                     signals[symbol] = signal
-                    self.logger.info(f"Generated {signal.signal_type} signal for {symbol}")
+                    self.logger.info("Generated %s signal for %s", signal.signal_type, symbol)
             except Exception as e:
-                self.logger.error(f"Error analyzing {symbol}: {str(e)}")
-            
-            # Add a small delay to avoid hitting rate limits
-            time.sleep(1)
+                self.logger.error("Error analyzing %s: %s", symbol, e)
         
         return signals
     
+    def _wait_for_request_slot(self) -> None:
+        """
+        Block until the next TradingView request may start. Up to REQUEST_BURST
+        requests start immediately, then starts are limited to MAX_REQUESTS_PER_SECOND.
+        """
+        # Refill the bucket and take a token, then wait outside the lock if it was borrowed
+        with self._rate_lock:
+            now = time.monotonic()
+            elapsed = now - self._tokens_updated_at
+            self._tokens_updated_at = now
+            self._request_tokens = min(float(self.REQUEST_BURST),
+                                       self._request_tokens + elapsed * self.MAX_REQUESTS_PER_SECOND)
+            self._request_tokens -= 1
+            wait = -self._request_tokens / self.MAX_REQUESTS_PER_SECOND
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _get_analysis(self, handler: TA_Handler):
+        """
+        Fetch the TradingView analysis for a handler, limiting the request rate
+        and the number of concurrent requests.
+        
+        Args:
+            handler (TA_Handler): TradingView TA handler to query
+            
+        Returns:
+            Analysis: TradingView analysis result
+        """
+        self._wait_for_request_slot()
+        with self._request_slots:
+            return handler.get_analysis()
+    
+    def _batch_fetch(self) -> Dict[str, object]:
+        """
+        Fetch the analysis of every symbol with one TradingView scan request per
+        screener, instead of one request per symbol.
+        
+        Returns:
+            Dict[str, Analysis]: Analysis per symbol; symbols TradingView didn't
+                return (or whose scan failed) are left out
+        """
+        # A scan request covers a single screener and interval
+        groups: Dict[Tuple[str, str], List[Tuple[str, TA_Handler]]] = {}
+        for symbol, handler in list(self.handlers.items()):
+            groups.setdefault((handler.screener, handler.interval), []).append((symbol, handler))
+        
+        analyses = {}
+        indicators_key = TradingView.indicators.copy()
+        headers = {"User-Agent": f"tradingview_ta/{tradingview_ta_version}",
+                   "Content-Type": "application/json"}
+        
+        for (screener, interval), entries in groups.items():
+            tickers = [f"{handler.exchange}:{handler.symbol}" for _, handler in entries]
+            try:
+                self._wait_for_request_slot()
+                with self._request_slots:
+                    response = self._session.post(
+                        f"{TradingView.scan_url}{screener.lower()}/scan",
+                        data=json_codec.dumps(TradingView.data(tickers, interval, indicators_key)),
+                        headers=headers,
+                        timeout=self.SCAN_TIMEOUT
+                    )
+                response.raise_for_status()
+                rows = {row["s"]: row["d"] for row in json_codec.loads(response.content)["data"]}
+            except Exception as e:
+                self.logger.warning("Batch scan failed for %s screener: %s", screener, e)
+                continue
+            
+            for (symbol, handler), ticker in zip(entries, tickers):
+                values = rows.get(ticker.upper())
+                if values is None:
+                    continue
+                # A bad row (e.g. a null indicator) only drops its own symbol,
+                # which then goes through the per-symbol path
+                try:
+                    analyses[symbol] = calculate(
+                        indicators=dict(zip(indicators_key, values)),
+                        indicators_key=indicators_key,
+                        screener=screener,
+                        symbol=handler.symbol,
+                        exchange=handler.exchange,
+                        interval=interval
+                    )
+                except Exception as e:
+                    self.logger.warning("Batch scan returned unusable data for %s: %s", symbol, e)
+                    continue
+        
+        return analyses
+    
     def analyze_symbol(self, symbol: str) -> Optional[TradingSignal]:
         """
         Analyze a single forex pair or crypto pair and generate a trading signal.
@@ -133,147 +499,227 @@ class MarketAnalyzer:
             Optional[TradingSignal]: Trading signal if conditions are met, None otherwise
         """
         if symbol not in self.handlers:
-            self.logger.warning(f"No handler found for {symbol}")
+            self.logger.warning("No handler found for %s", symbol)
             return None
         
         try:
             handler = self.handlers[symbol]
             # Add debug info
-            self.logger.info(f"Analyzing {symbol} with handler: exchange={handler.exchange}, screener={handler.screener}, symbol={handler.symbol}")
+            self.logger.info("Analyzing %s with handler: exchange=%s, screener=%s, symbol=%s",
+                             symbol, handler.exchange, handler.screener, handler.symbol)
             
             try:
-                analysis = handler.get_analysis()
+                analysis = self._get_analysis(handler)
                 if analysis is None:
-                    self.logger.warning(f"Received None analysis for {symbol}")
+                    self.logger.warning("Received None analysis for %s", symbol)
                     return None
             except Exception as e:
-                self.logger.error(f"Error getting analysis for {symbol}: {str(e)}")
+                self.logger.error("Error getting analysis for %s: %s", symbol, e)
+                analysis = None
                 if "Exchange or symbol not found" in str(e):
-                    # Try with different exchanges for crypto pairs
-                    if symbol.endswith("USDT"):
-                        alt_exchanges = ["KUCOIN", "COINBASE", "FTX"]
-                        for alt_exchange in alt_exchanges:
+                    # Try with different exchanges for crypto pairs, unless an
+                    # earlier search already found that none of them list it
+                    if _is_crypto(symbol) and _resolved_exchanges.get(handler.symbol, "") is not None:
+                        for alt_exchange in ALTERNATE_CRYPTO_EXCHANGES:
+                            if alt_exchange == handler.exchange:
+                                continue
                             try:
-                                self.logger.info(f"Trying alternate exchange {alt_exchange} for {symbol}")
-                                alt_handler = TA_Handler(
+                                self.logger.info("Trying alternate exchange %s for %s", alt_exchange, symbol)
+                                alt_handler = PooledTAHandler(
+                                    session=self._session,
                                     symbol=handler.symbol,
                                     exchange=alt_exchange,
                                     screener="crypto",
-                                    interval=handler.interval
+                                    interval=handler.interval,
+                                    timeout=self.SCAN_TIMEOUT
                                 )
-                                analysis = alt_handler.get_analysis()
+                                analysis = self._get_analysis(alt_handler)
                                 if analysis is not None:
-                                    self.logger.info(f"Successfully got data from {alt_exchange} for {symbol}")
+                                    self.logger.info("Successfully got data from %s for %s", alt_exchange, symbol)
                                     handler = alt_handler
                                     self.handlers[symbol] = alt_handler  # Update the handler
                                     break
                             except Exception as inner_e:
-                                self.logger.warning(f"Failed with {alt_exchange} for {symbol}: {str(inner_e)}")
+                                self.logger.warning("Failed with %s for %s: %s", alt_exchange, symbol, inner_e)
                                 continue
+                        
+                        _remember_exchange(handler.symbol, handler.exchange if analysis is not None else None)
                 if analysis is None:
                     raise Exception(f"Could not get data for {symbol} on any exchange")
-                
-            # Extract indicators
-            indicators = analysis.indicators
-            self.logger.info(f"Available indicators for {symbol}: {list(indicators.keys())}")
-            
-            # Get RSI value
-            rsi = indicators.get("RSI", None)
-            if rsi is None:
-                rsi = indicators.get(f"RSI{self.rsi_period}", None)
-                self.logger.debug(f"Using RSI{self.rsi_period} for {symbol}: {rsi}")
-            
-            # Get EMA values
-            ema_fast = indicators.get(f"EMA{self.ema_fast_period}", None)
-            ema_slow = indicators.get(f"EMA{self.ema_slow_period}", None)
             
-            self.logger.debug(f"Indicators for {symbol}: RSI={rsi}, EMA{self.ema_fast_period}={ema_fast}, EMA{self.ema_slow_period}={ema_slow}")
+            return self._signal_from_analysis(symbol, analysis)
             
-            if rsi is None or ema_fast is None or ema_slow is None:
-                self.logger.warning(f"Missing indicator data for {symbol}. RSI: {rsi}, EMA Fast: {ema_fast}, EMA Slow: {ema_slow}")
-                return None
-            
-            # Get current price
-            close_price = indicators.get("close", 0)
-            
-            # Check for signals
-            signal_type, signal_strength = self._evaluate_signals(rsi, ema_fast, ema_slow)
+        except Exception as e:
+            self.logger.error("Error in analyze_symbol for %s: %s", symbol, e)
+        
+        return None
+    
+    def _extract_indicators(self, symbol: str, analysis) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Extract the indicator values used for signals from a TradingView analysis.
+        
+        Args:
+            symbol (str): Trading pair the analysis belongs to
+            analysis (Analysis): TradingView analysis result
             
-            if signal_type != "NEUTRAL":
-                # Create and return a signal
-                # Ensure signal_type is one of the accepted literals
-                valid_signal_type = "BUY" if signal_type == "BUY" else "SELL" if signal_type == "SELL" else "NEUTRAL"
-                
-                signal = TradingSignal(
-                    symbol=symbol,
-                    signal_type=valid_signal_type,  # "BUY", "SELL", or "NEUTRAL"
-                    strength=signal_strength,  # 0.0 to 1.0
-                    price=close_price,
-                    rsi=rsi,
-                    ema_fast=ema_fast,
-                    ema_slow=ema_slow,
-                    timestamp=time.time()
-                )
-                return signal
+        Returns:
+            Optional[Tuple[float, float, float, float]]: RSI, fast EMA, slow EMA and close
+                price, or None if an indicator is missing
+        """
+        # Extract indicators
+        indicators = analysis.indicators
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Available indicators for %s: %s", symbol, list(indicators.keys()))
+        
+        # Get RSI value
+        rsi = indicators.get("RSI", None)
+        if rsi is None:
+            rsi = indicators.get(self._rsi_key_alt, None)
+            self.logger.debug("Using %s for %s: %s", self._rsi_key_alt, symbol, rsi)
+        
+        # Get EMA values
+        ema_fast = indicators.get(self._ema_fast_key, None)
+        ema_slow = indicators.get(self._ema_slow_key, None)
+        
+        self.logger.debug("Indicators for %s: RSI=%s, EMA%d=%s, EMA%d=%s", symbol, rsi,
+                          self.ema_fast_period, ema_fast, self.ema_slow_period, ema_slow)
+        
+        if rsi is None or ema_fast is None or ema_slow is None:
+            self.logger.warning("Missing indicator data for %s. RSI: %s, EMA Fast: %s, EMA Slow: %s",
+                                symbol, rsi, ema_fast, ema_slow)
+            return None
+        
+        # Get current price
+        close_price = indicators.get("close", 0)
+        
+        return rsi, ema_fast, ema_slow, close_price
+    
+    def _signal_from_analysis(self, symbol: str, analysis) -> Optional[TradingSignal]:
+        """
+        Generate a trading signal from a symbol's TradingView analysis.
+        
+        Args:
+            symbol (str): Trading pair the analysis belongs to
+            analysis (Analysis): TradingView analysis result
             
-        except Exception as e:
-            self.logger.error(f"Error in analyze_symbol for {symbol}: {str(e)}")
+        Returns:
+            Optional[TradingSignal]: Trading signal if conditions are met, None otherwise
+        """
+        values = self._extract_indicators(symbol, analysis)
+        if values is None:
+            return None
+        rsi, ema_fast, ema_slow, close_price = values
+        
+        # Check for signals
+        signal_type, signal_strength = self._evaluate_signals(rsi, ema_fast, ema_slow)
+        
+        if signal_type != "NEUTRAL":
+            # Create and return a signal
+            return TradingSignal(
+                symbol=symbol,
+                signal_type=signal_type,  # "BUY" or "SELL"
+                strength=signal_strength,  # 0.0 to 1.0
+                price=close_price,
+                rsi=rsi,
+                ema_fast=ema_fast,
+                ema_slow=ema_slow,
+                timestamp=time.time()
+            )
         
         return None
     
-    def _evaluate_signals(self, rsi: float, ema_fast: float, ema_slow: float) -> Tuple[str, float]:
+    def _signals_from_analyses(self, analyses: Dict[str, object]) -> Dict[str, TradingSignal]:
+        """
+        Generate trading signals for many analyses at once, evaluating all
+        symbols in a single vectorized pass.
+        
+        Args:
+            analyses (Dict[str, Analysis]): TradingView analysis per symbol
+            
+        Returns:
+            Dict[str, TradingSignal]: Signals for the symbols whose conditions are met
+        """
+        symbols = []
+        rows = []
+        for symbol, analysis in analyses.items():
+            try:
+                values = self._extract_indicators(symbol, analysis)
+            except Exception as e:
+                self.logger.error("Error analyzing %s: %s", symbol, e)
+                continue
+            if values is not None:
+                symbols.append(symbol)
+                rows.append(values)
+        
+        signals = {}
+        if not rows:
+            return signals
+        
+        columns = np.array(rows, dtype=np.float64)
+        codes, strengths = self._evaluate_signals_vec(columns[:, 0], columns[:, 1], columns[:, 2])
+        
+        # Materialize signals only for the non-neutral symbols
+        timestamp = time.time()
+        for i in np.flatnonzero(codes).tolist():
+            rsi, ema_fast, ema_slow, close_price = rows[i]
+            signals[symbols[i]] = TradingSignal(
+                symbol=symbols[i],
+                signal_type=SIGNAL_NAMES[int(codes[i])],
+                strength=float(strengths[i]),
+                price=close_price,
+                rsi=rsi,
+                ema_fast=ema_fast,
+                ema_slow=ema_slow,
+                timestamp=timestamp
+            )
+        
+        return signals
+    
+    def _evaluate_signals_vec(self, rsi: np.ndarray, ema_fast: np.ndarray,
+                              ema_slow: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Evaluate RSI and EMA indicators to determine trading signal.
+        Evaluate RSI and EMA indicators for many bars or symbols at once.
+        
+        Applies the same rules as _evaluate_signals, using array masks instead
+        of branches so batch evaluations (e.g. backtests) run in NumPy.
         
         Args:
-            rsi (float): RSI indicator value
-            ema_fast (float): Fast EMA value
-            ema_slow (float): Slow EMA value
+            rsi (np.ndarray): RSI indicator values
+            ema_fast (np.ndarray): Fast EMA values
+            ema_slow (np.ndarray): Slow EMA values
             
         Returns:
-            Tuple[str, float]: Signal type ("BUY", "SELL", "NEUTRAL") and strength (0.0 to 1.0)
+            Tuple[np.ndarray, np.ndarray]: Signal codes (1 = BUY, -1 = SELL, 0 = NEUTRAL)
+                as int8 and strengths (0.0 to 1.0)
         """
-        # Default signal
-        signal_type = "NEUTRAL"
-        signal_strength = 0.0
-        
-        # RSI signals
-        rsi_signal = "NEUTRAL"
-        if rsi < self.rsi_oversold:
-            rsi_signal = "BUY"
-            # Calculate how oversold (signal strength increases as RSI decreases below threshold)
-            rsi_strength = min(1.0, (self.rsi_oversold - rsi) / 10)
-        elif rsi > self.rsi_overbought:
-            rsi_signal = "SELL"
-            # Calculate how overbought (signal strength increases as RSI increases above threshold)
-            rsi_strength = min(1.0, (rsi - self.rsi_overbought) / 10)
-        else:
-            rsi_strength = 0.0
-        
-        # EMA crossover signals
-        ema_signal = "NEUTRAL"
-        if ema_fast > ema_slow:
-            ema_signal = "BUY"
-            # Calculate crossover strength (normalized difference between EMAs)
-            ema_strength = min(1.0, (ema_fast - ema_slow) / ema_slow * 10)
-        elif ema_fast < ema_slow:
-            ema_signal = "SELL"
-            # Calculate crossover strength (normalized difference between EMAs)
-            ema_strength = min(1.0, (ema_slow - ema_fast) / ema_slow * 10)
-        else:
-            ema_strength = 0.0
-        
-        # Combine signals (if both agree, stronger signal)
-        if rsi_signal == ema_signal and rsi_signal != "NEUTRAL":
-            signal_type = rsi_signal
-            # Combined strength (average of both signals with a bonus for agreement)
-            signal_strength = min(1.0, (rsi_strength + ema_strength) / 2 * 1.2)
-        # If they disagree, use the stronger signal
-        elif rsi_strength > ema_strength and rsi_signal != "NEUTRAL":
-            signal_type = rsi_signal
-            signal_strength = rsi_strength * 0.8  # Reduced confidence due to disagreement
-        elif ema_strength > 0 and ema_signal != "NEUTRAL":
-            signal_type = ema_signal
-            signal_strength = ema_strength * 0.8  # Reduced confidence due to disagreement
-        
-        return signal_type, signal_strength
+        rsi = np.asarray(rsi, dtype=np.float64)
+        ema_fast = np.asarray(ema_fast, dtype=np.float64)
+        ema_slow = np.asarray(ema_slow, dtype=np.float64)
+        
+        # RSI signals: strength grows by 0.1 per point beyond the threshold
+        oversold = rsi < self.rsi_oversold
+        overbought = ~oversold & (rsi > self.rsi_overbought)
+        rsi_signal = oversold.astype(np.int8) - overbought.astype(np.int8)
+        rsi_strength = np.where(oversold, np.minimum(1.0, (self.rsi_oversold - rsi) / 10),
+                                np.where(overbought, np.minimum(1.0, (rsi - self.rsi_overbought) / 10), 0.0))
+        
+        # EMA crossover signals: strength is the normalized gap between the EMAs
+        # A missing (NaN) EMA compares false both ways in _evaluate_signal_code, so mask
+        # it to NEUTRAL before the cast instead of letting NaN become an arbitrary int
+        ema_gap = ema_fast - ema_slow
+        ema_signal = np.where(np.isnan(ema_gap), 0.0, np.sign(ema_gap)).astype(np.int8)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ema_strength = np.where(ema_signal != 0,
+                                    np.minimum(1.0, np.abs(ema_gap) / ema_slow * 10), 0.0)
+        
+        # Combine signals: agreement boosts the average, otherwise the stronger one wins at reduced confidence
+        agree = (rsi_signal == ema_signal) & (rsi_signal != 0)
+        rsi_wins = ~agree & (rsi_strength > ema_strength) & (rsi_signal != 0)
+        ema_wins = ~agree & ~rsi_wins & (ema_strength > 0) & (ema_signal != 0)
+        
+        signal = np.where(agree | rsi_wins, rsi_signal, np.where(ema_wins, ema_signal, 0)).astype(np.int8)
+        strength = np.where(agree, np.minimum(1.0, (rsi_strength + ema_strength) / 2 * 1.2),
+                            np.where(rsi_wins, rsi_strength * 0.8,
+                                     np.where(ema_wins, ema_strength * 0.8, 0.0)))
+        
+        return signal, strength
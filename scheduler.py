@@ -6,6 +6,7 @@ Schedules and manages regular market analysis and trading.
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
@@ -36,6 +37,10 @@ class Scheduler:
         self.running = False
         self.scheduler_thread = None
         self.last_run_time = None
+        self._cycle_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        # Runs the broker status refresh alongside the market analysis
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trade-status")
         
         self.logger.info(f"Scheduler initialized with interval: {analysis_interval_minutes} minutes")
     
@@ -48,6 +53,7 @@ class Scheduler:
             return
         
         self.running = True
+        self._stop_event.clear()
         self.scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self.scheduler_thread.start()
         
@@ -62,9 +68,15 @@ class Scheduler:
             return
         
         self.running = False
+        self._stop_event.set()  # Wake the loop if it is waiting for the next cycle
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=3.0)  # Wait up to 3 seconds for thread to finish
         
+        # Wait for any in-flight status refresh, then swap in a fresh pool so
+        # the scheduler can be restarted or run_now() called again
+        self._executor.shutdown(wait=True)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trade-status")
+        
         self.logger.info("Scheduler stopped")
     
     def _scheduler_loop(self) -> None:
@@ -81,26 +93,21 @@ class Scheduler:
                 # Update last run time
                 self.last_run_time = datetime.now()
                 
-                # Reset daily trade counter at midnight
-                current_time = datetime.now()
-                if current_time.hour == 0 and current_time.minute < self.analysis_interval_seconds // 60:
-                    self.trade_executor.reset_daily_counter()
-                    self.logger.info("Daily trade counter reset")
+                # The trade executor resets its daily trade counter itself when the date changes
                 
                 # Sleep until next cycle
                 interval_text = "minute" if self.analysis_interval_seconds == 60 else "minutes"
                 self.logger.info(f"Next analysis in {self.analysis_interval_seconds // 60} {interval_text}")
                 
-                # Check if we should still be running every second
-                for _ in range(self.analysis_interval_seconds):
-                    if not self.running:
-                        break
-                    time.sleep(1)
+                # Wait for the next cycle; stop() sets the event to end the wait early
+                if self._stop_event.wait(timeout=self.analysis_interval_seconds):
+                    break
                     
             except Exception as e:
                 self.logger.error(f"Error in scheduler loop: {str(e)}")
-                # Sleep for a short period before retrying
-                time.sleep(30)
+                # Wait for a short period before retrying
+                if self._stop_event.wait(timeout=30):
+                    break
         
         self.logger.info("Scheduler loop stopped")
     
@@ -108,35 +115,47 @@ class Scheduler:
         """
         Run a single analysis and trading cycle.
         """
-        cycle_start_time = datetime.now()
-        self.logger.info(f"Starting analysis cycle at {cycle_start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        try:
-            # First, update status of active trades
-            self.trade_executor.update_active_trades()
-            
-            # Analyze the markets
-            signals = self.market_analyzer.analyze_markets()
-            self.logger.info(f"Analysis complete. Found {len(signals)} trading signals")
+        # Hold the cycle lock so a manual run can't overlap a scheduled one
+        with self._cycle_lock:
+            cycle_start = time.monotonic()
+            self.logger.info(f"Starting analysis cycle at {time.strftime('%Y-%m-%d %H:%M:%S')}")
             
-            # Execute trades based on signals
-            if signals:
-                executed_trades = self.trade_executor.execute_trades(signals)
-                self.logger.info(f"Executed {len(executed_trades)} trades")
-            else:
-                self.logger.info("No trades executed - no valid signals")
+            try:
+                # Update the status of active trades while the markets are analyzed;
+                # both are network bound and independent of each other
+                status_update = self._executor.submit(self.trade_executor.update_active_trades)
+                
+                # Analyze the markets
+                try:
+                    signals = self.market_analyzer.analyze_markets()
+                finally:
+                    # Trades must be up to date before new ones are executed; this
+                    # also keeps active_trades from being mutated by the status
+                    # thread while execute_trades reads it below
+                    status_update.result()
+                self.logger.info(f"Analysis complete. Found {len(signals)} trading signals")
+                
+                # Execute trades based on signals
+                if signals:
+                    executed_trades = self.trade_executor.execute_trades(signals)
+                    self.logger.info(f"Executed {len(executed_trades)} trades")
+                else:
+                    self.logger.info("No trades executed - no valid signals")
+                
+            except Exception as e:
+                self.logger.error(f"Error during analysis cycle: {str(e)}")
             
-        except Exception as e:
-            self.logger.error(f"Error during analysis cycle: {str(e)}")
-        
-        cycle_end_time = datetime.now()
-        duration = (cycle_end_time - cycle_start_time).total_seconds()
-        self.logger.info(f"Analysis cycle completed in {duration:.2f} seconds")
+            duration = time.monotonic() - cycle_start
+            self.logger.info(f"Analysis cycle completed in {duration:.2f} seconds")
     
     def run_now(self) -> None:
         """
         Run an analysis cycle immediately, outside of the normal schedule.
         """
+        if self._cycle_lock.locked():
+            self.logger.info("Analysis cycle already in progress; skipping immediate run")
+            return
+        
         self.logger.info("Running immediate analysis cycle")
         
         # Run in a separate thread to avoid blocking
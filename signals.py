@@ -7,10 +7,12 @@ from dataclasses import dataclass
 from typing import Literal, Dict, Any
 import time
 
+import json_codec
+
 # Define signal type literal
 SignalType = Literal["BUY", "SELL", "NEUTRAL"]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradingSignal:
     """
     Represents a trading signal with relevant information.
@@ -27,6 +29,7 @@ class TradingSignal:
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert trading signal to dictionary.
+        The timestamp is left unformatted; use to_dict_with_time for a readable time.
         
         Returns:
             Dict[str, Any]: Dictionary representation of the signal
@@ -39,10 +42,29 @@ class TradingSignal:
             "rsi": self.rsi,
             "ema_fast": self.ema_fast,
             "ema_slow": self.ema_slow,
-            "timestamp": self.timestamp,
-            "time": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.timestamp))
+            "timestamp": self.timestamp
         }
     
+    def to_dict_with_time(self) -> Dict[str, Any]:
+        """
+        Convert trading signal to dictionary, including the formatted local time.
+        
+        Returns:
+            Dict[str, Any]: Dictionary representation of the signal with a "time" key
+        """
+        data = self.to_dict()
+        data["time"] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.timestamp))
+        return data
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the trading signal to UTF-8 JSON.
+        
+        Returns:
+            bytes: JSON encoding of to_dict()
+        """
+        return json_codec.dumps(self.to_dict())
+    
     def __repr__(self) -> str:
         """
         String representation of the trading signal.
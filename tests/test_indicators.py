@@ -0,0 +1,73 @@
+"""
+Tests for the technical indicators module.
+"""
+
+import numpy as np
+import pytest
+
+from indicators import calculate_macd, calculate_rsi, calculate_rsi_series, detect_support_resistance
+
+def _reference_ema(values, period):
+    """SMA-seeded EMA over values[period - 1:], computed step by step."""
+    alpha = 2 / (period + 1)
+    ema = sum(values[:period]) / period
+    series = [ema]
+    for value in values[period:]:
+        ema += (value - ema) * alpha
+        series.append(ema)
+    return series
+
+# Closing prices of the 14-period RSI worked example published by StockCharts
+WILDER_PRICES = [
+    44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84, 46.08, 45.89,
+    46.03, 45.61, 46.28, 46.28, 46.00, 46.03, 46.41, 46.22, 45.64, 46.21, 46.25,
+    45.71, 46.45, 45.78, 45.35, 44.03, 44.18, 44.22, 44.57, 43.42, 42.66, 43.13,
+]
+
+
+def test_rsi_uses_wilder_smoothing():
+    rsi = calculate_rsi_series(WILDER_PRICES, 14)
+    
+    # One value per bar after the warm-up; the published table rounds its
+    # intermediate averages, hence the tolerance
+    assert len(rsi) == len(WILDER_PRICES) - 14
+    assert rsi[0] == pytest.approx(70.53, abs=0.1)
+    assert rsi[-1] == pytest.approx(37.77, abs=0.1)
+    assert calculate_rsi(WILDER_PRICES, 14) == rsi[-1]
+
+
+def test_rsi_without_losses_is_100():
+    assert calculate_rsi(list(np.arange(1.0, 20.0)), 14) == 100.0
+
+
+def test_macd_signal_is_ema_of_macd_series():
+    prices = list(100 + 5 * np.sin(np.arange(80) / 6))
+    
+    fast = _reference_ema(prices, 12)
+    slow = _reference_ema(prices, 26)
+    macd_series = [f - s for f, s in zip(fast[-len(slow):], slow)]
+    signal = _reference_ema(macd_series, 9)[-1]
+    
+    macd_line, signal_line, histogram = calculate_macd(prices)
+    
+    assert macd_line == pytest.approx(macd_series[-1], rel=1e-9)
+    assert signal_line == pytest.approx(signal, rel=1e-9)
+    # The signal line used to be the EMA of a single value, so the histogram was always 0
+    assert histogram == pytest.approx(macd_line - signal_line)
+    assert abs(histogram) > 0.5
+
+
+def test_support_resistance_levels_are_ascending_and_separated():
+    # Swings that widen over time, so troughs are found in descending order
+    t = np.arange(120)
+    prices = list(100 + np.sin(t / 4) * (1 + t / 30))
+    
+    levels = detect_support_resistance(prices, window=5, threshold=0.001)
+    
+    for kind in ("support", "resistance"):
+        found = levels[kind]
+        assert len(found) >= 3
+        assert found == sorted(found)
+        # Kept levels are at least threshold apart
+        assert all((b - a) / b >= 0.001 for a, b in zip(found, found[1:]))
+    assert max(levels["support"]) < 100 < min(levels["resistance"])
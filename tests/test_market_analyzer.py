@@ -0,0 +1,60 @@
+"""
+Tests for the market analyzer module.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from market_analyzer import MarketAnalyzer, _evaluate_signal_code, _is_crypto
+
+
+@pytest.mark.parametrize("symbol, expected", [
+    # Crypto pairs: no separator, quoted in a stablecoin or major coin
+    ("BTCUSDT", True),
+    ("ETHUSDT", True),
+    ("ethusdt", True),
+    ("SOLBUSD", True),
+    ("ADAUSDC", True),
+    ("ETHBTC", True),
+    ("LINKETH", True),
+    # Forex pairs use the BASE/QUOTE notation
+    ("USD/CHF", False),
+    ("USD/JPY", False),
+    ("GBP/USD", False),
+    ("ETH/USDT", False),
+    # Slash-less symbols that merely contain "USD" are not crypto
+    ("XAUUSD", False),
+    ("EURUSD", False),
+    ("USDCHF", False),
+])
+def test_is_crypto(symbol, expected):
+    assert _is_crypto(symbol) is expected
+
+
+def test_vectorized_signals_match_scalar_on_nan_rows():
+    # Only the thresholds are needed; skip the handler and config setup
+    analyzer = MarketAnalyzer.__new__(MarketAnalyzer)
+    analyzer.rsi_oversold = 30.0
+    analyzer.rsi_overbought = 70.0
+
+    nan = float("nan")
+    rows = np.array([
+        (25.0, 1.1010, 1.1000),
+        (nan, 1.1010, 1.1000),
+        (75.0, nan, 1.1000),
+        (25.0, 1.1010, nan),
+        (nan, nan, nan),
+        (50.0, nan, nan),
+        (80.0, 1.0990, 1.1000),
+    ])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        codes, strengths = analyzer._evaluate_signals_vec(rows[:, 0], rows[:, 1], rows[:, 2])
+
+    for (rsi, ema_fast, ema_slow), code, strength in zip(rows, codes, strengths):
+        expected_code, expected_strength = _evaluate_signal_code(rsi, ema_fast, ema_slow, 30.0, 70.0)
+        assert code == expected_code
+        assert strength == pytest.approx(expected_strength)
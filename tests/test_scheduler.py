@@ -0,0 +1,54 @@
+"""
+Tests for the scheduler's analysis and trading cycle.
+"""
+
+import threading
+import time
+
+from scheduler import Scheduler
+
+
+class FakeAnalyzer:
+    def analyze_markets(self):
+        return ["signal"]
+
+
+class FakeExecutor:
+    def __init__(self):
+        self.active_trades = {}
+        self.seen_by_execute = None
+        self.status_thread = None
+
+    def update_active_trades(self):
+        self.status_thread = threading.current_thread()
+        # Finish well after the analysis so an early read would miss the update
+        time.sleep(0.05)
+        self.active_trades["T1"] = "closed"
+
+    def execute_trades(self, signals):
+        self.seen_by_execute = dict(self.active_trades)
+        return []
+
+
+def test_execute_trades_sees_completed_status_update():
+    executor = FakeExecutor()
+    scheduler = Scheduler(FakeAnalyzer(), executor, analysis_interval_minutes=1)
+
+    scheduler._run_cycle()
+
+    assert executor.status_thread is not threading.current_thread()
+    assert executor.seen_by_execute == {"T1": "closed"}
+
+
+def test_stop_shuts_down_status_pool_and_allows_restart():
+    executor = FakeExecutor()
+    scheduler = Scheduler(FakeAnalyzer(), executor, analysis_interval_minutes=1)
+    old_pool = scheduler._executor
+
+    scheduler.start()
+    scheduler.stop()
+
+    assert old_pool._shutdown
+    executor.active_trades.clear()
+    scheduler._run_cycle()
+    assert executor.seen_by_execute == {"T1": "closed"}
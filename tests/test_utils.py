@@ -0,0 +1,80 @@
+"""
+Tests for the batch and specialized helpers in the utils module.
+"""
+
+import numpy as np
+import pytest
+
+from forex_pairs import SUPPORTED_PAIRS
+from utils import (PositionBook, calculate_profit_loss, specialize_profit_loss,
+                   trade_parameter_errors, validate_trade_parameters,
+                   validate_trade_parameters_batch)
+
+SYMBOL = SUPPORTED_PAIRS[0]
+
+
+def test_batch_validation_matches_scalar():
+    trades = [
+        (SYMBOL, 1000.0, 1.2, 1.1),
+        (SYMBOL, 0.0, 1.2, 1.1),
+        ("XXX/YYY", 1000.0, 1.2, 1.1),
+        (SYMBOL, 1000.0, -1.0, 1.1),
+        (SYMBOL, 1000.0, 1.2, -1.0),
+        ("XXX/YYY", -5.0, -1.0, -1.0),
+        (SYMBOL, 0.01, 0.0, 0.0),
+    ]
+    symbols = [trade[0] for trade in trades]
+    amounts, take_profits, stop_losses = (np.array(column) for column in list(zip(*trades))[1:])
+
+    valid = validate_trade_parameters_batch(symbols, amounts, take_profits, stop_losses)
+    errors = trade_parameter_errors(symbols, amounts, take_profits, stop_losses)
+
+    for i, trade in enumerate(trades):
+        expected = validate_trade_parameters(*trade)
+        assert valid[i] == expected["valid"]
+        if expected["valid"]:
+            assert i not in errors
+        else:
+            assert errors[i] == expected["errors"]
+
+
+def test_position_book_revalue_matches_scalar():
+    rng = np.random.default_rng(7)
+    positions = {}
+    # Start small so adding positions has to grow the storage
+    book = PositionBook(capacity=2)
+    for n in range(10):
+        params = (rng.uniform(1.0, 1.5), rng.uniform(0.01, 2.0), bool(n % 3))
+        positions[f"P{n}"] = params
+        book.add(f"P{n}", *params)
+
+    # Swap-removal moves the last position into the freed slot
+    for symbol in ("P0", "P4", "P9"):
+        book.remove(book.symbols.index(symbol))
+        del positions[symbol]
+
+    assert sorted(book.symbols) == sorted(positions)
+    current = rng.uniform(1.0, 1.5, size=len(book))
+    expected = []
+    for symbol, price in zip(book.symbols, current):
+        entry_price, lot_size, is_buy = positions[symbol]
+        expected.append(calculate_profit_loss(entry_price, price, lot_size, is_buy))
+    assert book.revalue(current) == pytest.approx(expected)
+
+    with pytest.raises(IndexError):
+        book.remove(len(book))
+
+
+@pytest.mark.parametrize("lot_size, is_buy, with_jpy", [
+    (1.0, True, False),
+    (1.0, False, False),
+    (0.25, True, True),
+    (2.5, False, True),
+])
+def test_specialized_profit_loss_matches_scalar(lot_size, is_buy, with_jpy):
+    profit_loss = specialize_profit_loss(lot_size, is_buy, with_jpy)
+    assert specialize_profit_loss(lot_size, is_buy, with_jpy) is profit_loss
+
+    for entry_price, current_price in ((1.1000, 1.1050), (1.1000, 1.0950), (150.20, 149.85)):
+        expected = calculate_profit_loss(entry_price, current_price, lot_size, is_buy, with_jpy)
+        assert profit_loss(entry_price, current_price) == pytest.approx(expected)
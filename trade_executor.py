@@ -3,26 +3,40 @@ Trade Executor module for forex trading bot.
 Responsible for executing trades based on trading signals.
 """
 
+import atexit
 import logging
+import os
+import shelve
+import threading
 import time
 from datetime import datetime, date
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from broker_api import AllCashBrokerAPI
 from signals import TradingSignal
 
+# Shelf holding active trades and the daily trade count across restarts,
+# kept next to this module so it doesn't depend on the working directory
+STATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "trade_state")
+
 class TradeExecutor:
     """
     Executes trades based on trading signals.
     Manages trade parameters and limits.
     """
     
+    # Signals weaker than this are not traded
+    MIN_SIGNAL_STRENGTH = 0.5
+    
     def __init__(self, 
                  broker_api: AllCashBrokerAPI,
                  trade_amount: float = 100.0,
                  take_profit_pips: int = 20,
                  stop_loss_pips: int = 10,
-                 max_trades_per_day: int = 5):
+                 max_trades_per_day: int = 5,
+                 symbols: Optional[List[str]] = None):
         """
         Initialize Trade Executor.
         
@@ -32,6 +46,7 @@ class TradeExecutor:
             take_profit_pips (int): Take profit level in pips
             stop_loss_pips (int): Stop loss level in pips
             max_trades_per_day (int): Maximum number of trades allowed per day
+            symbols (Optional[List[str]]): Pairs that will be traded, to precompute their pip values
         """
         self.logger = logging.getLogger(__name__)
         self.broker_api = broker_api
@@ -40,9 +55,28 @@ class TradeExecutor:
         self.stop_loss_pips = stop_loss_pips
         self.max_trades_per_day = max_trades_per_day
         
-        # Track daily trades
-        self.daily_trades = {}  # date -> count
+        # Track daily trades (the count is reset lazily when the date changes)
+        self.trade_date = date.today()
+        self.daily_trade_count = 0
         self.active_trades = {}  # symbol -> trade_id
+        self._lock = threading.Lock()  # Guards the daily count, active_trades and the shelf
+        
+        # Restore the state saved by a previous run, so a restart doesn't lose track of trades.
+        # Persistence is best effort: if the shelf can't be used, state stays in memory only
+        self._store = None
+        try:
+            self._store = shelve.open(STATE_FILE, writeback=False)
+            self._load_state()
+        except Exception as e:
+            self.logger.error(f"Error opening trade state {STATE_FILE}: {str(e)}. "
+                              f"Keeping trade state in memory only.")
+            self.active_trades = {}
+            self.daily_trade_count = 0
+            self._close_store()
+        atexit.register(self.close)
+        
+        # Pip value per symbol, filled up front for the known pairs and on demand for others
+        self._pip_values = {symbol: self._compute_pip_value(symbol) for symbol in symbols or ()}
         
         self.logger.info(f"TradeExecutor initialized with amount={trade_amount}, "
                          f"TP={take_profit_pips}pips, SL={stop_loss_pips}pips, "
@@ -61,102 +95,130 @@ class TradeExecutor:
         executed_trades = []
         
         # Check if we've reached the daily trade limit
-        today = date.today().isoformat()
-        daily_count = self.daily_trades.get(today, 0)
+        self.reset_daily_counter()
+        daily_count = self.daily_trade_count
         
         if daily_count >= self.max_trades_per_day:
             self.logger.warning(f"Daily trade limit reached ({self.max_trades_per_day}). No trades executed.")
             return executed_trades
         
-        # Sort signals by strength (descending)
-        sorted_signals = sorted(
-            signals.values(),
-            key=lambda s: s.strength,
-            reverse=True
-        )
-        
-        # Execute trades for the strongest signals first (up to the daily limit)
-        trades_left = self.max_trades_per_day - daily_count
-        for signal in sorted_signals[:trades_left]:
-            # Skip weak signals
-            if signal.strength < 0.5:
-                self.logger.info(f"Skipping weak signal for {signal.symbol} (strength={signal.strength:.2f})")
-                continue
-                
-            # Check if we already have an active trade for this symbol
-            if signal.symbol in self.active_trades:
-                self.logger.info(f"Already have an active trade for {signal.symbol}. Skipping.")
+        # Skip weak signals, non-trade signals and symbols we already have an active trade for
+        actionable = [
+            s for s in signals.values()
+            if s.strength >= self.MIN_SIGNAL_STRENGTH
+            and s.signal_type in ("BUY", "SELL")
+            and s.symbol not in self.active_trades
+        ]
+        
+        # Execute trades for the strongest signals first (up to the daily limit);
+        # only the top trades_left signals are needed, so find the cut-off strength
+        # with a partition in O(n) and sort just those. Ties at the cut-off go to
+        # the earliest signals, so selection is deterministic
+        trades_left = min(self.max_trades_per_day - daily_count, len(actionable))
+        strengths = np.fromiter((s.strength for s in actionable), dtype=np.float64, count=len(actionable))
+        if trades_left < len(actionable):
+            cutoff = -np.partition(-strengths, trades_left - 1)[trades_left - 1]
+            above = np.flatnonzero(strengths > cutoff)
+            tied = np.flatnonzero(strengths == cutoff)[:trades_left - len(above)]
+            top = np.sort(np.concatenate((above, tied)))
+        else:
+            top = np.arange(len(actionable))
+        top = top[np.argsort(-strengths[top], kind="stable")]
+        strongest_signals = [actionable[i] for i in top.tolist()]
+        if len(strongest_signals) < len(signals):
+            self.logger.info(f"{len(signals) - len(strongest_signals)} signals skipped (weak, neutral, "
+                             f"already traded or over the daily limit)")
+        
+        # Build the orders and place them concurrently; each is an independent
+        # broker round trip, so the batch takes about as long as the slowest one
+        orders = []
+        order_signals = []
+        for signal in strongest_signals:
+            try:
+                order = self._build_order(signal)
+            except Exception as e:
+                self.logger.error(f"Error executing trade for {signal.symbol}: {str(e)}")
                 continue
+            if order is not None:
+                orders.append(order)
+                order_signals.append(signal)
+        
+        trade_ids = self.broker_api.place_orders_bulk(orders) if orders else []
+        
+        with self._lock:
+            for signal, trade_id in zip(order_signals, trade_ids):
+                if not trade_id:
+                    continue
                 
-            # Execute the trade
-            trade_id = self._execute_signal(signal)
-            if trade_id:
                 executed_trades.append(trade_id)
                 self.active_trades[signal.symbol] = trade_id
                 
                 # Update daily trade count
-                self.daily_trades[today] = daily_count + 1
                 daily_count += 1
+                self.daily_trade_count = daily_count
                 
                 self.logger.info(f"Trade executed for {signal.symbol} (ID: {trade_id})")
-                
-                # Don't exceed daily trade limit
-                if daily_count >= self.max_trades_per_day:
-                    self.logger.info(f"Daily trade limit reached ({self.max_trades_per_day}). Stopping execution.")
-                    break
+            
+            if executed_trades:
+                self._save_state()
+        
+        if daily_count >= self.max_trades_per_day:
+            self.logger.info(f"Daily trade limit reached ({self.max_trades_per_day}).")
         
         return executed_trades
     
-    def _execute_signal(self, signal: TradingSignal) -> Optional[str]:
+    def _build_order(self, signal: TradingSignal) -> Optional[Dict[str, Any]]:
         """
-        Execute a single trading signal.
+        Build the broker order for a trading signal, with TP/SL derived from pips.
         
         Args:
             signal (TradingSignal): Trading signal to execute
             
         Returns:
-            Optional[str]: Trade ID if successful, None otherwise
+            Optional[Dict[str, Any]]: Order for AllCashBrokerAPI.place_orders_bulk,
+                or None for signals that aren't BUY or SELL
         """
-        try:
-            symbol = signal.symbol
-            price = signal.price
-            
-            # Convert pips to price movement (depends on currency pair)
-            pip_value = self._get_pip_value(symbol)
-            take_profit = price + (self.take_profit_pips * pip_value) if signal.signal_type == "BUY" else \
-                          price - (self.take_profit_pips * pip_value)
-            stop_loss = price - (self.stop_loss_pips * pip_value) if signal.signal_type == "BUY" else \
-                        price + (self.stop_loss_pips * pip_value)
-            
-            # Execute the trade
-            if signal.signal_type == "BUY":
-                trade_id = self.broker_api.place_buy_order(
-                    symbol=symbol,
-                    amount=self.trade_amount,
-                    take_profit=take_profit,
-                    stop_loss=stop_loss
-                )
-            elif signal.signal_type == "SELL":
-                trade_id = self.broker_api.place_sell_order(
-                    symbol=symbol,
-                    amount=self.trade_amount,
-                    take_profit=take_profit,
-                    stop_loss=stop_loss
-                )
-            else:
-                self.logger.warning(f"Invalid signal type: {signal.signal_type}")
-                return None
-            
-            return trade_id
-            
-        except Exception as e:
-            self.logger.error(f"Error executing trade for {signal.symbol}: {str(e)}")
+        if signal.signal_type not in ("BUY", "SELL"):
+            self.logger.warning(f"Invalid signal type: {signal.signal_type}")
             return None
+        
+        price = signal.price
+        
+        # Convert pips to price movement (depends on currency pair)
+        pip_value = self._get_pip_value(signal.symbol)
+        take_profit = price + (self.take_profit_pips * pip_value) if signal.signal_type == "BUY" else \
+                      price - (self.take_profit_pips * pip_value)
+        stop_loss = price - (self.stop_loss_pips * pip_value) if signal.signal_type == "BUY" else \
+                    price + (self.stop_loss_pips * pip_value)
+        
+        return {
+            "direction": signal.signal_type,
+            "symbol": signal.symbol,
+            "amount": self.trade_amount,
+            "take_profit": take_profit,
+            "stop_loss": stop_loss
+        }
     
     def _get_pip_value(self, symbol: str) -> float:
         """
         Get the pip value for a forex pair.
         
+        Args:
+            symbol (str): Forex pair (e.g., "GBP/USD")
+            
+        Returns:
+            float: Value of 1 pip in price units
+        """
+        pip_value = self._pip_values.get(symbol)
+        if pip_value is None:
+            pip_value = self._pip_values[symbol] = self._compute_pip_value(symbol)
+        return pip_value
+    
+    @staticmethod
+    def _compute_pip_value(symbol: str) -> float:
+        """
+        Work out the pip value for a forex pair from its currencies.
+        
         Args:
             symbol (str): Forex pair (e.g., "GBP/USD")
             
@@ -184,11 +246,13 @@ class TradeExecutor:
             
             # Update our records if successful
             if result:
-                for symbol, tid in list(self.active_trades.items()):
-                    if tid == trade_id:
-                        del self.active_trades[symbol]
-                        self.logger.info(f"Removed {symbol} from active trades after closing")
-                        break
+                with self._lock:
+                    for symbol, tid in list(self.active_trades.items()):
+                        if tid == trade_id:
+                            del self.active_trades[symbol]
+                            self._save_state()
+                            self.logger.info(f"Removed {symbol} from active trades after closing")
+                            break
             
             return result
             
@@ -203,46 +267,116 @@ class TradeExecutor:
         Returns:
             int: Number of trades successfully closed
         """
-        closed_count = 0
+        active = list(self.active_trades.items())
         
-        for symbol, trade_id in list(self.active_trades.items()):
-            try:
-                if self.broker_api.close_order(trade_id):
-                    del self.active_trades[symbol]
+        # Close every trade in one concurrent batch
+        results = self.broker_api.close_orders([trade_id for _, trade_id in active])
+        
+        closed_count = 0
+        with self._lock:
+            for symbol, trade_id in active:
+                if results.get(trade_id):
+                    if self.active_trades.get(symbol) == trade_id:
+                        del self.active_trades[symbol]
                     closed_count += 1
                     self.logger.info(f"Closed trade for {symbol} (ID: {trade_id})")
                 else:
                     self.logger.warning(f"Failed to close trade for {symbol} (ID: {trade_id})")
-            except Exception as e:
-                self.logger.error(f"Error closing trade for {symbol} (ID: {trade_id}): {str(e)}")
+            
+            if closed_count:
+                self._save_state()
         
-        self.logger.info(f"Closed {closed_count} trades out of {len(self.active_trades)} active trades")
+        self.logger.info(f"Closed {closed_count} trades out of {len(active)} active trades")
         return closed_count
     
     def update_active_trades(self) -> None:
         """
         Update the status of active trades and close any that hit take profit or stop loss.
         """
-        for symbol, trade_id in list(self.active_trades.items()):
-            try:
-                # Get the current status of the trade
-                trade_status = self.broker_api.get_order_status(trade_id)
+        active = list(self.active_trades.items())
+        if not active:
+            return
+        
+        # Get the current status of all active trades in one concurrent batch
+        statuses = self.broker_api.get_orders_status([trade_id for _, trade_id in active])
+        
+        with self._lock:
+            removed = False
+            for symbol, trade_id in active:
+                trade_status = statuses.get(trade_id)
+                if trade_status is None:
+                    continue  # Lookup failed; the broker API already logged it
                 
                 if trade_status.get("status") == "CLOSED":
                     # Trade was already closed (hit TP/SL or closed manually)
-                    del self.active_trades[symbol]
+                    if self.active_trades.get(symbol) == trade_id:
+                        del self.active_trades[symbol]
+                        removed = True
                     self.logger.info(f"Trade for {symbol} (ID: {trade_id}) is already closed")
-                    
-                # Optionally, you could implement trailing stop-loss or other dynamic management here
                 
-            except Exception as e:
-                self.logger.error(f"Error updating trade for {symbol} (ID: {trade_id}): {str(e)}")
+                # Optionally, you could implement trailing stop-loss or other dynamic management here
+            
+            if removed:
+                self._save_state()
     
     def reset_daily_counter(self) -> None:
         """
         Reset the daily trade counter if it's a new day.
+        Called at the start of every execute_trades, so calling it on a schedule is optional.
         """
-        today = date.today().isoformat()
+        today = date.today()
+        if today != self.trade_date:
+            with self._lock:
+                if today != self.trade_date:
+                    self.trade_date = today
+                    self.daily_trade_count = 0
+                    self._save_state()
+    
+    def _load_state(self) -> None:
+        """
+        Load active trades and today's trade count from the state shelf.
+        A count saved on an earlier day is discarded.
+        """
+        self.active_trades = dict(self._store.get("active_trades", {}))
+        if self._store.get("trade_date") == self.trade_date.isoformat():
+            self.daily_trade_count = self._store.get("daily_trade_count", 0)
+        
+        if self.active_trades or self.daily_trade_count:
+            self.logger.info(f"Restored {len(self.active_trades)} active trades and "
+                             f"{self.daily_trade_count} trades today from {STATE_FILE}")
+    
+    def _save_state(self) -> None:
+        """
+        Write active trades and the daily trade count through to the state shelf.
+        Must be called with self._lock held.
+        """
+        if self._store is None:
+            return
+        
+        try:
+            self._store["active_trades"] = self.active_trades
+            self._store["trade_date"] = self.trade_date.isoformat()
+            self._store["daily_trade_count"] = self.daily_trade_count
+            self._store.sync()
+        except Exception as e:
+            self.logger.error(f"Error saving trade state to {STATE_FILE}: {str(e)}")
+    
+    def close(self) -> None:
+        """
+        Close the state shelf. Registered with atexit.
+        """
+        with self._lock:
+            self._close_store()
+    
+    def _close_store(self) -> None:
+        """
+        Close the state shelf, if open, and stop persisting state.
+        """
+        if self._store is None:
+            return
         
-        # Keep only today's counter, remove old dates
-        self.daily_trades = {today: self.daily_trades.get(today, 0)}
+        try:
+            self._store.close()
+        except Exception as e:
+            self.logger.error(f"Error closing trade state {STATE_FILE}: {str(e)}")
+        self._store = None
@@ -3,8 +3,46 @@ Utility functions for forex trading bot.
 """
 
 import time
-from datetime import datetime
-from typing import List, Dict, Any
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, List, Dict, Any, Mapping, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import numpy as np
+
+from forex_pairs import SUPPORTED_PAIRS_SET
+import json_codec
+
+# Forex trading hours are defined in New York time
+try:
+    _EASTERN = ZoneInfo("America/New_York")
+except ZoneInfoNotFoundError:  # No tz database; fall back to EST year round
+    _EASTERN = timezone(timedelta(hours=-5), "EST")
+
+# Unix timestamps of the current or next trading week's open (Sunday 5 PM ET)
+# and close (Friday 5 PM ET), recomputed by is_market_open once the close passes
+_trading_week = (float("-inf"), float("-inf"))
+
+# Prebuilt formatters for the usual currency precisions
+_CURRENCY_FORMATS = {precision: f"${{:.{precision}f}}".format for precision in range(9)}
+
+# Formatter for pip values (0.1 pip resolution)
+_PIP_FORMAT = "{:.1f} pips".format
+
+# Price-to-pips multiplier, indexed by with_jpy
+_PIP_MULTIPLIERS = (10000.0, 100.0)
+
+# Shared read-only result for trades that pass validate_trade_parameters
+_VALID_TRADE = MappingProxyType({"valid": True, "errors": ()})
+
+# JSON encoding of _VALID_TRADE
+_VALID_TRADE_JSON = json_codec.dumps({"valid": True, "errors": []})
+
+# Prebuilt humanize_time_ago strings for ages under a day
+_SECONDS_AGO = tuple(f"{n} seconds ago" for n in range(60))
+_MINUTES_AGO = tuple(f"{n} minutes ago" for n in range(60))
+_HOURS_AGO = tuple(f"{n} hours ago" for n in range(24))
 
 def format_currency(value: float, precision: int = 2) -> str:
     """
@@ -17,7 +55,10 @@ def format_currency(value: float, precision: int = 2) -> str:
     Returns:
         str: Formatted currency string
     """
-    return f"${value:.{precision}f}"
+    formatter = _CURRENCY_FORMATS.get(precision)
+    if formatter is None:
+        return f"${value:.{precision}f}"
+    return formatter(value)
 
 def format_pip_value(value: float, with_jpy: bool = False) -> str:
     """
@@ -30,10 +71,27 @@ def format_pip_value(value: float, with_jpy: bool = False) -> str:
     Returns:
         str: Formatted pip value string
     """
-    if with_jpy:
-        return f"{value * 100:.1f} pips"
-    else:
-        return f"{value * 10000:.1f} pips"
+    pips = value * _PIP_MULTIPLIERS[bool(with_jpy)]
+    
+    # Dashboards repaint the same few rounded values, so cache by the displayed value;
+    # round() matches the rounding of the format. Zero skips the cache to keep "-0.0"
+    rounded = round(pips, 1)
+    if not rounded:
+        return _PIP_FORMAT(rounded)
+    return _format_rounded_pips(rounded)
+
+@lru_cache(maxsize=8192)
+def _format_rounded_pips(pips: float) -> str:
+    """
+    Format a pip value already rounded to 0.1 pip.
+    
+    Args:
+        pips (float): Value in pips
+        
+    Returns:
+        str: Formatted pip value string
+    """
+    return _PIP_FORMAT(pips)
 
 def calculate_profit_loss(entry_price: float, current_price: float, 
                          lot_size: float, is_buy: bool, with_jpy: bool = False) -> float:
@@ -45,20 +103,63 @@ def calculate_profit_loss(entry_price: float, current_price: float,
         current_price (float): Current price
         lot_size (float): Lot size
         is_buy (bool): Whether the position is a buy (True) or sell (False)
-        with_jpy (bool): Whether the pair involves JPY
+        with_jpy (bool): Whether the pair involves JPY (kept for compatibility; the
+            pip factor cancels out, so it doesn't change the result)
         
     Returns:
         float: Profit/loss amount
     """
-    pip_factor = 0.01 if with_jpy else 0.0001
-    lot_factor = 100000  # Standard lot size
+    lot_factor = 100000.0  # Standard lot size
     
-    if is_buy:
-        pip_difference = (current_price - entry_price) / pip_factor
-    else:
-        pip_difference = (entry_price - current_price) / pip_factor
+    sign = 2.0 * bool(is_buy) - 1.0  # 1.0 for buys, -1.0 for sells
+    return sign * (current_price - entry_price) * lot_factor * lot_size
+
+def calculate_profit_loss_batch(entry_price: np.ndarray, current_price: np.ndarray,
+                                lot_size: np.ndarray, is_buy: np.ndarray) -> np.ndarray:
+    """
+    Calculate profit/loss for many positions at once.
     
-    return pip_difference * pip_factor * lot_factor * lot_size
+    Same result as calculate_profit_loss per position. The pip factor cancels out
+    of that formula, so JPY pairs need no special handling here.
+    
+    Args:
+        entry_price (np.ndarray): Entry prices
+        current_price (np.ndarray): Current prices
+        lot_size (np.ndarray): Lot sizes
+        is_buy (np.ndarray): Boolean mask, True for buy positions and False for sells
+        
+    Returns:
+        np.ndarray: Profit/loss amount per position
+    """
+    sign = np.where(is_buy, 1.0, -1.0)
+    return sign * (np.asarray(current_price, dtype=np.float64) - entry_price) * 100000.0 * lot_size
+
+@lru_cache(maxsize=64)
+def specialize_profit_loss(lot_size: float, is_buy: bool,
+                           with_jpy: bool = False) -> Callable[[float, float], float]:
+    """
+    Build a profit/loss function for a fixed lot size and direction.
+    
+    The direction sign and lot size are folded into one constant, so pricing
+    a position on each tick is a subtraction and a multiply. Functions are
+    cached, so positions with the same parameters share one.
+    
+    Args:
+        lot_size (float): Lot size
+        is_buy (bool): Whether the position is a buy (True) or sell (False)
+        with_jpy (bool): Whether the pair involves JPY (the pip factor cancels
+            out of the profit/loss, so this doesn't change the result)
+        
+    Returns:
+        Callable[[float, float], float]: Function taking the entry and current
+            prices and returning the same amount as calculate_profit_loss
+    """
+    factor = (1.0 if is_buy else -1.0) * 100000.0 * lot_size
+    
+    def profit_loss(entry_price: float, current_price: float, _factor: float = factor) -> float:
+        return (current_price - entry_price) * _factor
+    
+    return profit_loss
 
 def humanize_time_ago(timestamp: float) -> str:
     """
@@ -70,59 +171,79 @@ def humanize_time_ago(timestamp: float) -> str:
     Returns:
         str: Human-readable time ago string
     """
-    now = time.time()
-    diff = now - timestamp
+    diff = int(time.time() - timestamp)
     
     if diff < 60:
-        return f"{int(diff)} seconds ago"
+        # Timestamps in the future give negative ages, which the table doesn't cover
+        return _SECONDS_AGO[diff] if diff >= 0 else f"{diff} seconds ago"
     elif diff < 3600:
-        return f"{int(diff / 60)} minutes ago"
+        return _MINUTES_AGO[diff // 60]
     elif diff < 86400:
-        return f"{int(diff / 3600)} hours ago"
+        return _HOURS_AGO[diff // 3600]
     else:
-        return f"{int(diff / 86400)} days ago"
+        return f"{diff // 86400} days ago"
 
-def is_market_open() -> bool:
+def _trading_week_bounds(timestamp: float) -> Tuple[float, float]:
     """
-    Check if forex market is currently open.
+    Get the open and close of the trading week that ends after a given moment.
     
+    Args:
+        timestamp (float): Unix timestamp
+        
     Returns:
-        bool: True if market is open, False otherwise
+        Tuple[float, float]: Unix timestamps of the week's open (Sunday 5 PM ET)
+            and close (the first Friday 5 PM ET after timestamp)
     """
     # Forex market is typically open 24/5 starting Sunday 5 PM ET to Friday 5 PM ET
-    now = datetime.now()
-    
-    # Check if it's a weekend (Saturday=5, Sunday=6)
-    if now.weekday() == 5:
-        return False  # Saturday - market closed
+    now = datetime.fromtimestamp(timestamp, _EASTERN)
+    close = (now + timedelta(days=(4 - now.weekday()) % 7)).replace(hour=17, minute=0, second=0, microsecond=0)
+    if close.timestamp() <= timestamp:
+        close += timedelta(days=7)
     
-    if now.weekday() == 6 and now.hour < 17:
-        return False  # Sunday before 5 PM - market closed
+    # Wall-clock arithmetic, so the open stays at 5 PM across DST changes
+    week_open = close - timedelta(days=5)
+    return week_open.timestamp(), close.timestamp()
+
+def is_market_open() -> bool:
+    """
+    Check if forex market is currently open (in New York time).
     
-    if now.weekday() == 4 and now.hour >= 17:
-        return False  # Friday after 5 PM - market closed
+    Returns:
+        bool: True if market is open, False otherwise
+    """
+    global _trading_week
     
-    return True  # Market is open
+    now = time.time()
+    week_open, week_close = _trading_week
+    # Recompute once the close passes, or if the clock was set back past the previous close
+    if not week_close - 7 * 86400 <= now < week_close:
+        week_open, week_close = _trading_week = _trading_week_bounds(now)
+    return now >= week_open
 
 def validate_trade_parameters(symbol: str, amount: float, take_profit: float, 
-                            stop_loss: float) -> Dict[str, Any]:
+                            stop_loss: float) -> Mapping[str, Any]:
     """
     Validate trade parameters.
     
     Args:
-        symbol (str): Forex pair symbol
+        symbol (str): Forex pair symbol (must be one of forex_pairs.SUPPORTED_PAIRS)
         amount (float): Trade amount
         take_profit (float): Take profit level
         stop_loss (float): Stop loss level
         
     Returns:
-        Dict[str, Any]: Dictionary with validation result and errors
+        Mapping[str, Any]: Validation result and errors (a shared read-only
+            mapping with an empty errors tuple when the trade is valid)
     """
+    # Valid trades are the common case; skip building a result for them
+    if symbol in SUPPORTED_PAIRS_SET and amount > 0 and take_profit >= 0 and stop_loss >= 0:
+        return _VALID_TRADE
+    
     errors = []
     
     # Check symbol
-    if not symbol or "/" not in symbol:
-        errors.append("Invalid symbol format")
+    if symbol not in SUPPORTED_PAIRS_SET:
+        errors.append("Unsupported symbol")
     
     # Check amount
     if amount <= 0:
@@ -140,3 +261,165 @@ def validate_trade_parameters(symbol: str, amount: float, take_profit: float,
         "valid": len(errors) == 0,
         "errors": errors
     }
+
+def validate_trade_parameters_json(symbol: str, amount: float, take_profit: float,
+                                   stop_loss: float) -> bytes:
+    """
+    Validate trade parameters and return the result encoded as JSON.
+    
+    Valid trades get a pre-encoded constant, so only failures are serialized.
+    
+    Args:
+        symbol (str): Forex pair symbol (must be one of forex_pairs.SUPPORTED_PAIRS)
+        amount (float): Trade amount
+        take_profit (float): Take profit level
+        stop_loss (float): Stop loss level
+        
+    Returns:
+        bytes: UTF-8 JSON object with "valid" and "errors" keys
+    """
+    result = validate_trade_parameters(symbol, amount, take_profit, stop_loss)
+    if result is _VALID_TRADE:
+        return _VALID_TRADE_JSON
+    return json_codec.dumps({"valid": result["valid"], "errors": list(result["errors"])})
+
+def validate_trade_parameters_batch(symbols: List[str], amounts: np.ndarray,
+                                    take_profits: np.ndarray, stop_losses: np.ndarray) -> np.ndarray:
+    """
+    Validate the parameters of many trades at once.
+    
+    Applies the same checks as validate_trade_parameters to parallel arrays.
+    
+    Args:
+        symbols (List[str]): Forex pair symbol per trade
+        amounts (np.ndarray): Trade amounts
+        take_profits (np.ndarray): Take profit levels
+        stop_losses (np.ndarray): Stop loss levels
+        
+    Returns:
+        np.ndarray: Boolean mask, True for trades with valid parameters
+    """
+    symbol_ok = np.fromiter((symbol in SUPPORTED_PAIRS_SET for symbol in symbols),
+                            dtype=bool, count=len(symbols))
+    return np.logical_and.reduce((
+        symbol_ok,
+        np.asarray(amounts) > 0,
+        np.asarray(take_profits) >= 0,
+        np.asarray(stop_losses) >= 0
+    ))
+
+def trade_parameter_errors(symbols: List[str], amounts: np.ndarray,
+                           take_profits: np.ndarray, stop_losses: np.ndarray) -> Dict[int, List[str]]:
+    """
+    Get the validation errors of the invalid trades in a batch.
+    
+    Only the trades rejected by validate_trade_parameters_batch are checked
+    one by one, so valid trades cost nothing beyond the batch pass.
+    
+    Args:
+        symbols (List[str]): Forex pair symbol per trade
+        amounts (np.ndarray): Trade amounts
+        take_profits (np.ndarray): Take profit levels
+        stop_losses (np.ndarray): Stop loss levels
+        
+    Returns:
+        Dict[int, List[str]]: Errors by trade index, for invalid trades only
+    """
+    valid = validate_trade_parameters_batch(symbols, amounts, take_profits, stop_losses)
+    return {
+        i: validate_trade_parameters(symbols[i], amounts[i], take_profits[i], stop_losses[i])["errors"]
+        for i in np.flatnonzero(~valid).tolist()
+    }
+
+class PositionBook:
+    """
+    Open positions stored as parallel arrays, so the whole book is revalued
+    with one calculate_profit_loss_batch call.
+    """
+    
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize an empty PositionBook.
+        
+        Args:
+            capacity (int): Number of positions to allocate room for up front
+        """
+        capacity = max(1, capacity)
+        self.symbols: List[str] = []
+        self._entry_price = np.empty(capacity, dtype=np.float64)
+        self._lot_size = np.empty(capacity, dtype=np.float64)
+        self._is_buy = np.empty(capacity, dtype=bool)
+    
+    def __len__(self) -> int:
+        return len(self.symbols)
+    
+    @property
+    def entry_price(self) -> np.ndarray:
+        """np.ndarray: Entry price per position"""
+        return self._entry_price[:len(self)]
+    
+    @property
+    def lot_size(self) -> np.ndarray:
+        """np.ndarray: Lot size per position"""
+        return self._lot_size[:len(self)]
+    
+    @property
+    def is_buy(self) -> np.ndarray:
+        """np.ndarray: True for buy positions, False for sells"""
+        return self._is_buy[:len(self)]
+    
+    def add(self, symbol: str, entry_price: float, lot_size: float, is_buy: bool) -> int:
+        """
+        Add a position to the book.
+        
+        Args:
+            symbol (str): Forex pair symbol
+            entry_price (float): Entry price
+            lot_size (float): Lot size
+            is_buy (bool): Whether the position is a buy (True) or sell (False)
+            
+        Returns:
+            int: Index of the position
+        """
+        index = len(self)
+        if index == len(self._entry_price):
+            # Double the storage when full
+            capacity = 2 * index
+            self._entry_price = np.resize(self._entry_price, capacity)
+            self._lot_size = np.resize(self._lot_size, capacity)
+            self._is_buy = np.resize(self._is_buy, capacity)
+        
+        self._entry_price[index] = entry_price
+        self._lot_size[index] = lot_size
+        self._is_buy[index] = is_buy
+        self.symbols.append(symbol)
+        return index
+    
+    def remove(self, index: int) -> None:
+        """
+        Remove a position from the book. The last position takes its index.
+        
+        Args:
+            index (int): Index of the position to remove
+        """
+        last = len(self) - 1
+        if not 0 <= index <= last:
+            raise IndexError(f"Position index out of range: {index}")
+        
+        self._entry_price[index] = self._entry_price[last]
+        self._lot_size[index] = self._lot_size[last]
+        self._is_buy[index] = self._is_buy[last]
+        self.symbols[index] = self.symbols[last]
+        self.symbols.pop()
+    
+    def revalue(self, current_price: np.ndarray) -> np.ndarray:
+        """
+        Calculate the profit/loss of every position.
+        
+        Args:
+            current_price (np.ndarray): Current price per position, in book order
+            
+        Returns:
+            np.ndarray: Profit/loss amount per position
+        """
+        return calculate_profit_loss_batch(self.entry_price, current_price, self.lot_size, self.is_buy)